@@ -34,6 +34,9 @@ class SingleRowSwitchGenerator(SwitchSVGGenerator):
                 New code should use SwitchSVGGenerator with layout_mode=LayoutMode.SINGLE_ROW instead.
     """
     
+    # No extra attributes; keep the parent's slot layout
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         """
         Initialize the single row switch generator.
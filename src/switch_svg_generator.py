@@ -17,11 +17,14 @@ Features:
 """
 
 import argparse
+import hashlib
+import io
 import os
 import sys
-import webbrowser
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Dict, List, Tuple, Optional, Union, Set, Any
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union, Set, Any, TextIO
 import logging
 from PIL import Image, ImageDraw, ImageFont
 
@@ -68,9 +71,74 @@ class LayoutMode(Enum):
     SINGLE_ROW = "single_row"
 
 
+# Fill colors for the per-port status indicator circles (the stroke is always black)
+_STATUS_INDICATOR_FILL = {
+    PortStatus.UP: "#2ecc71",        # Green for UP
+    PortStatus.DOWN: "#e74c3c",      # Red for DOWN
+    PortStatus.DISABLED: "#000000",  # Black for DISABLED
+}
+
+# Display strings for port tooltips, looked up instead of reading .value per port
+_STATUS_STR = {status: status.value for status in PortStatus}
+
+# Attribute fragments shared by the regular and SFP port templates
+_PORT_OUTLINE_ATTRS = 'stroke="#000000" stroke-width="1"'
+_PORT_TEXT_ATTRS = 'font-family="Arial" font-size="10" fill="white" text-anchor="middle" dominant-baseline="middle"'
+
+# SVG line templates for ports; %s keeps the formatting identical to str()
+_PORT_GROUP_OPEN = '  <g id="port-%s">'
+_PORT_TITLE_TMPL = '    <title>Port: %s, Label: %s, Status: %s, VLAN: %s</title>'
+_PORT_RECT_TMPL = '    <rect x="%s" y="%s" width="%s" height="%s" fill="%s" ' + _PORT_OUTLINE_ATTRS + ' rx="%s" ry="%s" />'
+_PORT_TEXT_TMPL = '    <text x="%s" y="%s" ' + _PORT_TEXT_ATTRS + '>%s</text>'
+_PORT_CIRCLE_TMPL = '    <circle cx="%s" cy="%s" r="3" fill="%s" stroke="#000000" stroke-width="0.5" />'
+_PORT_GROUP_CLOSE = '  </g>'
+
+# SVG line templates for SFP ports
+_SFP_GROUP_OPEN = '  <g id="sfp-%s">'
+_SFP_TITLE_TMPL = '    <title>SFP Port: %s, Label: %s, VLAN: %s</title>'
+_SFP_RECT_TMPL = '    <rect x="%s" y="%s" width="%s" height="%s" fill="%s" ' + _PORT_OUTLINE_ATTRS + ' rx="2" ry="2" />'
+_SFP_TEXT_TMPL = _PORT_TEXT_TMPL
+_SFP_CIRCLE_TMPL = '    <circle cx="%s" cy="%s" r="3" fill="%s" stroke="white" stroke-width="0.5" />'
+_SFP_GROUP_CLOSE = _PORT_GROUP_CLOSE
+
+# Whole port groups as one multi-line template each, so every port is emitted
+# with a single formatting operation (with and without a status indicator)
+_PORT_BLOCK_TMPL = '\n'.join((_PORT_GROUP_OPEN, _PORT_TITLE_TMPL, '%s', _PORT_GROUP_CLOSE))
+_PORT_BLOCK_IND_TMPL = '\n'.join((_PORT_GROUP_OPEN, _PORT_TITLE_TMPL, '%s', _PORT_CIRCLE_TMPL, _PORT_GROUP_CLOSE))
+_SFP_BLOCK_TMPL = '\n'.join((_SFP_GROUP_OPEN, _SFP_TITLE_TMPL, _SFP_RECT_TMPL, _SFP_TEXT_TMPL, _SFP_GROUP_CLOSE))
+_SFP_BLOCK_IND_TMPL = '\n'.join((_SFP_GROUP_OPEN, _SFP_TITLE_TMPL, _SFP_RECT_TMPL, _SFP_TEXT_TMPL,
+                                  _SFP_CIRCLE_TMPL, _SFP_GROUP_CLOSE))
+
+
+def _sorted_items(mapping: Dict[Any, Any]) -> List[Tuple[Any, Any]]:
+    """
+    Sort the items of a mapping for use in a cache key.
+    
+    Items are ordered by key type name and key repr, so mappings that mix
+    key types (for example int and str port numbers) never compare keys
+    of different types.
+    """
+    return sorted(mapping.items(), key=lambda item: (type(item[0]).__name__, repr(item[0])))
+
+
 class SwitchSVGGenerator:
     """Class to generate SVG representations of network switches with colored ports."""
 
+    # Fixed attribute layout for faster attribute access; __dict__ is kept so
+    # callers can still attach their own attributes to a generator
+    # (body_width, actual_body_width and ports_width are set by calculate_dimensions)
+    __slots__ = (
+        'num_ports', 'sfp_ports', 'sfp_layout', 'sfp_group_size', 'sfp_only_mode',
+        'port_start_number', 'zigzag_start_position', 'switch_width', 'switch_height',
+        'port_width', 'port_height', 'port_spacing', 'port_group_size', 'port_group_spacing',
+        'port_shape', 'vlan_colors', 'port_vlan_map', 'port_status_map', 'port_labels',
+        'output_file', 'switch_model', 'model_name', 'switch_name', 'theme', 'theme_colors',
+        'show_status_indicator', 'legend_spacing', 'legend_items_spacing', 'legend_item_padding',
+        'legend_row_offset', 'switch_body_color', 'switch_body_border_color',
+        'switch_body_border_width', 'layout_mode', 'body_width', 'actual_body_width', 'ports_width',
+        '__dict__',
+    )
+
     # Default VLAN colors
     DEFAULT_VLAN_COLORS = {
         1: "#3498db",    # Default VLAN - Blue
@@ -104,6 +172,34 @@ class SwitchSVGGenerator:
         }
     }
 
+    # SVG header lines; only the size, port count, model, theme and background vary
+    _SVG_HEADER_TEMPLATE = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        '<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">\n'
+        '  <!-- Network Switch SVG generated by SwitchSVGGenerator -->\n'
+        '  <!-- {num_ports} port switch ({model}) -->\n'
+        '  <!-- Generated with theme: {theme} -->\n'
+        '  <!-- Background for entire image -->\n'
+        '  <rect x="0" y="0" width="{width}" height="{height}" fill="{background}" />'
+    )
+
+    # Rendered SVG cache shared by all instances, keyed by a digest of the
+    # generator state (bounded LRU: oldest entries are evicted first)
+    _SVG_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+    _SVG_CACHE_MAXSIZE = 256
+
+    # Attributes that do not affect the rendered SVG, or that are derived
+    # from other attributes by calculate_dimensions()
+    _SVG_CACHE_IGNORED_ATTRS = frozenset({"output_file", "body_width", "actual_body_width", "ports_width"})
+
+    # Port rectangle and label markup shared by all instances, keyed by every
+    # input except port status, so status-only changes reuse the port bodies
+    _PORT_BODY_CACHE: "OrderedDict[tuple, List[str]]" = OrderedDict()
+
+    # Guards every access to the class-level caches, which are shared by
+    # generators in all threads (rendering itself runs outside the lock)
+    _CACHE_LOCK = threading.Lock()
+
     def __init__(
         self,
         num_ports: int = 24,
@@ -398,6 +494,98 @@ class SwitchSVGGenerator:
         # Scale by font size ratio (assuming the mapping is for 10px)
         return total_width * (font_size / 10)
 
+    def calculate_port_positions(self, start_x: int, start_y: int) -> List[Tuple[int, int]]:
+        """
+        Calculate the (x, y) position of every regular port.
+        
+        The x coordinate of each column and the y coordinate of each row are
+        computed once, then looked up per port, so the port emit loop only has
+        to format strings.
+        
+        Args:
+            start_x: X coordinate of the first port column
+            start_y: Y coordinate of the top port row
+            
+        Returns:
+            List of (x, y) tuples, one per regular port
+        """
+        row_spacing = 4  # Use the same row spacing as defined in calculate_dimensions
+        indices = range(self.num_ports)
+        
+        if self.layout_mode == LayoutMode.SINGLE_ROW:
+            # Single row layout - every port gets its own column in row 0
+            cols = list(indices)
+            rows = [0] * self.num_ports
+            group_size = self.port_group_size
+        else:  # ZIGZAG layout
+            # Even ports go in the starting row, odd ports in the other row
+            first_row = 0 if self.zigzag_start_position == "top" else 1
+            cols = [i // 2 for i in indices]
+            rows = [(i + first_row) % 2 for i in indices]
+            # Each zigzag column holds 2 ports, so groups span half as many columns
+            group_size = max(1, self.port_group_size // 2)
+        
+        # Compute each column's x once; zigzag ports share a column in pairs
+        column_pitch = self.port_width + self.port_spacing
+        num_cols = cols[-1] + 1 if cols else 0
+        if self.port_group_size > 0:
+            column_xs = [start_x + col * column_pitch + (col // group_size) * self.port_group_spacing
+                         for col in range(num_cols)]
+        else:
+            column_xs = [start_x + col * column_pitch for col in range(num_cols)]
+        
+        row_pitch = self.port_height + row_spacing
+        row_ys = (start_y, start_y + row_pitch)
+        
+        return [(column_xs[col], row_ys[row]) for col, row in zip(cols, rows)]
+
+    def calculate_sfp_positions(self, sfp_start_x: int, start_y: int,
+                                sfp_width: int, sfp_port_spacing: int) -> List[Tuple[int, int]]:
+        """
+        Calculate the (x, y) position of every SFP port.
+        
+        Mirrors calculate_port_positions: row and column indices are computed
+        for the whole SFP block first, then turned into coordinates.
+        
+        Args:
+            sfp_start_x: X coordinate of the first SFP column
+            start_y: Y coordinate of the top port row
+            sfp_width: Width of a single SFP port
+            sfp_port_spacing: Horizontal spacing between SFP ports
+            
+        Returns:
+            List of (x, y) tuples, one per SFP port
+        """
+        row_spacing = 4  # Use the same row spacing as defined in calculate_dimensions
+        indices = range(self.sfp_ports)
+        
+        if self.sfp_layout == "horizontal":
+            # All SFP ports in one row, aligned with the bottom row in zigzag layout
+            cols = list(indices)
+            row = 0 if self.layout_mode == LayoutMode.SINGLE_ROW else 1
+            rows = [row] * self.sfp_ports
+        else:  # Default to zigzag layout
+            first_row = 0 if self.zigzag_start_position == "top" else 1
+            cols = [i // 2 for i in indices]
+            if self.layout_mode == LayoutMode.SINGLE_ROW:
+                rows = [0] * self.sfp_ports
+            else:
+                rows = [(i + first_row) % 2 for i in indices]
+        
+        # Compute each column's x once; zigzag ports share a column in pairs
+        column_pitch = sfp_width + sfp_port_spacing
+        num_cols = cols[-1] + 1 if cols else 0
+        if self.sfp_group_size > 0:
+            column_xs = [sfp_start_x + col * column_pitch + (col // self.sfp_group_size) * self.port_group_spacing
+                         for col in range(num_cols)]
+        else:
+            column_xs = [sfp_start_x + col * column_pitch for col in range(num_cols)]
+        
+        row_pitch = self.port_height + row_spacing
+        row_ys = (start_y, start_y + row_pitch)
+        
+        return [(column_xs[col], row_ys[row]) for col, row in zip(cols, rows)]
+
     def calculate_dimensions(self) -> Tuple[int, int, int, int]:
         """
         Calculate the dimensions for the switch and port layout.
@@ -668,18 +856,17 @@ class SwitchSVGGenerator:
             adjusted_height: The calculated height of the SVG
             
         Returns:
-            List of SVG header lines
+            List holding the SVG header lines as a single pre-joined string
         """
-        svg = [
-            f'<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
-            f'<svg width="{adjusted_width}" height="{adjusted_height}" xmlns="http://www.w3.org/2000/svg">',
-            f'  <!-- Network Switch SVG generated by SwitchSVGGenerator -->',
-            f'  <!-- {self.num_ports} port switch ({self.switch_model.value}) -->',
-            f'  <!-- Generated with theme: {self.theme.value} -->',
-            f'  <!-- Background for entire image -->',
-            f'  <rect x="0" y="0" width="{adjusted_width}" height="{adjusted_height}" fill="{self.theme_colors["background"]}" />'
-        ]
-        return svg
+        header = self._SVG_HEADER_TEMPLATE.format(
+            width=adjusted_width,
+            height=adjusted_height,
+            num_ports=self.num_ports,
+            model=self.switch_model.value,
+            theme=self.theme.value,
+            background=self.theme_colors["background"],
+        )
+        return [header]
 
     def generate_switch_body(self, adjusted_width: int, adjusted_height: int) -> List[str]:
         """
@@ -789,7 +976,40 @@ class SwitchSVGGenerator:
         
         return svg
 
-    def generate_legend(self, adjusted_width: int, adjusted_height: int) -> List[str]:
+    @staticmethod
+    def layout_legend_items(item_widths: List[float], start_x: int, start_y: int,
+                            available_width: float, row_offset: int) -> List[Tuple[float, float]]:
+        """
+        Calculate the position of every legend item, wrapping onto new rows.
+        
+        Items are packed greedily from left to right; an item that would
+        overflow the available width starts a new row, unless it is the
+        first item.
+        
+        Args:
+            item_widths: Width of each legend item
+            start_x: X coordinate where every row starts
+            start_y: Y coordinate of the first row
+            available_width: Maximum width of a row
+            row_offset: Vertical distance between rows
+            
+        Returns:
+            List of (x, y) tuples, one per legend item
+        """
+        max_x = start_x + available_width
+        x = start_x
+        y = start_y
+        positions = []
+        for item_width in item_widths:
+            if x + item_width > max_x and positions:
+                # Start a new row
+                x = start_x
+                y += row_offset
+            positions.append((x, y))
+            x += item_width
+        return positions
+
+    def generate_legend(self, adjusted_width: int, adjusted_height: int) -> Iterator[str]:
         """
         Generate the SVG content for the VLAN and status legend.
         
@@ -797,11 +1017,10 @@ class SwitchSVGGenerator:
             adjusted_width: The calculated width of the SVG
             adjusted_height: The calculated height of the SVG
             
-        Returns:
-            List of SVG lines for the legend
+        Yields:
+            SVG lines for the legend
         """
-        svg = []
-        svg.append(f'  <!-- Legend -->')
+        yield f'  <!-- Legend -->'
         
         # Place legend under the switch
         # Start from the left side, aligned with the switch body
@@ -816,23 +1035,27 @@ class SwitchSVGGenerator:
         legend_title_y = switch_bottom + self.legend_spacing
         
         # Add a legend title
-        svg.append(f'  <text x="{legend_x}" y="{legend_title_y}" font-family="Arial" '
-                  f'font-size="12" font-weight="bold" fill="{self.theme_colors["text"]}">Legend:</text>')
+        yield (f'  <text x="{legend_x}" y="{legend_title_y}" font-family="Arial" '
+              f'font-size="12" font-weight="bold" fill="{self.theme_colors["text"]}">Legend:</text>')
         
         # Position VLAN section title below the legend title with additional 3px spacing
         vlan_section_y = legend_title_y + self.legend_items_spacing + 3  # Added 3px extra spacing
-        svg.append(f'  <text x="{legend_x}" y="{vlan_section_y}" font-family="Arial" '
-                  f'font-size="11" font-weight="bold" fill="{self.theme_colors["text"]}">VLANs:</text>')
+        yield (f'  <text x="{legend_x}" y="{vlan_section_y}" font-family="Arial" '
+              f'font-size="11" font-weight="bold" fill="{self.theme_colors["text"]}">VLANs:</text>')
         
         # Position legend items below the VLAN section title
         legend_items_y = vlan_section_y + self.legend_items_spacing
         
         # Debug logging to help diagnose spacing issues
-        logger.info(f"Legend spacing: title_y={legend_title_y}, items_y={legend_items_y}, spacing={self.legend_items_spacing}")
+        logger.debug("Legend spacing: title_y=%s, items_y=%s, spacing=%s",
+                     legend_title_y, legend_items_y, self.legend_items_spacing)
         
         # VLAN Legend
+        # Each legend item is (label, color, is_circle); VLAN items are drawn as
+        # boxes and status items as circles, so classify them once up front
         used_vlans = self.get_used_vlans()
-        legend_items = []
+        vlan_items = []
+        status_items = []
         
         # VLAN names dictionary - can be expanded with more descriptive names
         vlan_names = {
@@ -858,163 +1081,84 @@ class SwitchSVGGenerator:
                 legend_text = f"{vlan_id}, {vlan_name}"
             else:
                 legend_text = f"{vlan_id}"
-            legend_items.append((legend_text, color))
+            vlan_items.append((legend_text, color, False))
         
         # Status Legend - always show for switches with 4 or more ports
+        # The full set of statuses is populated here, so the emit loop below
+        # never has to patch in missing entries afterwards
         if self.num_ports >= 4:
-            # Always add all three status indicators for completeness
-            legend_items.append(("Port up", "#2ecc71"))      # Green for UP
-            legend_items.append(("Port down", "#e74c3c"))    # Red for DOWN
-            legend_items.append(("Port disabled", "#000000"))  # Black for DISABLED
+            status_items.extend([
+                ("Port up", _STATUS_INDICATOR_FILL[PortStatus.UP], True),
+                ("Port down", _STATUS_INDICATOR_FILL[PortStatus.DOWN], True),
+                ("Port disabled", _STATUS_INDICATOR_FILL[PortStatus.DISABLED], True),
+            ])
         
         # We no longer need a separate SFP port legend entry since SFP ports use their VLAN colors
         
-        # Separate VLAN items and status items
-        vlan_items = []
-        status_items = []
-        
-        for label, color in legend_items:
-            if label.startswith("Port "):
-                status_items.append((label, color))
-            else:
-                vlan_items.append((label, color))
-        
         # Calculate available width for legend items (switch body width minus margins)
         # Use the body_width to constrain legend items to the switch width
         available_legend_width = self.body_width - 2 * legend_x + 20  # Add 20px for margins
         
         # Calculate how much width each VLAN item would need
         vlan_item_widths = []
-        for label, _ in vlan_items:
+        for label, _, _ in vlan_items:
             text_width = self.get_text_width(label, font_size=10, font_family="Arial")
             # Add 15px for the color box and spacing, plus text width, plus padding
             item_width = 15 + text_width + self.legend_item_padding
             vlan_item_widths.append(item_width)
-            logger.info(f"Legend item '{label}' width: {text_width}px, total: {item_width}px")
+            logger.debug("Legend item '%s' width: %spx, total: %spx", label, text_width, item_width)
         
         # Distribute VLAN items across rows
-        row_y = legend_items_y
-        current_x = legend_x
-        current_row_width = 0
+        text_color = self.theme_colors["text"]
+        vlan_positions = self.layout_legend_items(vlan_item_widths, legend_x, legend_items_y,
+                                                  available_legend_width, self.legend_row_offset)
+        row_y = vlan_positions[-1][1] if vlan_positions else legend_items_y
         
-        for i, ((label, color), item_width) in enumerate(zip(vlan_items, vlan_item_widths)):
-            # Check if this item would exceed the available width
-            if current_x + item_width > legend_x + available_legend_width and i > 0:
-                # Start a new row
-                row_y += self.legend_row_offset  # Move down 25px for the next row
-                current_x = legend_x
-                current_row_width = 0
-            
+        for (label, color, _), (item_x, item_y) in zip(vlan_items, vlan_positions):
             # Draw the color box
-            svg.append(f'  <rect x="{current_x}" y="{row_y}" width="10" height="10" fill="{color}" stroke="#000000" stroke-width="1" />')
+            yield f'  <rect x="{item_x}" y="{item_y}" width="10" height="10" fill="{color}" stroke="#000000" stroke-width="1" />'
             
             # Draw the text
-            svg.append(f'  <text x="{current_x + 15}" y="{row_y + 9}" font-family="Arial" '
-                      f'font-size="10" fill="{self.theme_colors["text"]}">{label}</text>')
-            
-            # Move to the next item position
-            current_x += item_width
-            current_row_width += item_width
+            yield (f'  <text x="{item_x + 15}" y="{item_y + 9}" font-family="Arial" '
+                  f'font-size="10" fill="{text_color}">{label}</text>')
         
         # Add status items on a new row if there are any
         if status_items:
             # Position status section title on a new row
             status_section_y = row_y + 25
-            svg.append(f'  <text x="{legend_x}" y="{status_section_y}" font-family="Arial" '
-                      f'font-size="11" font-weight="bold" fill="{self.theme_colors["text"]}">Port Status:</text>')
+            yield (f'  <text x="{legend_x}" y="{status_section_y}" font-family="Arial" '
+                  f'font-size="11" font-weight="bold" fill="{self.theme_colors["text"]}">Port Status:</text>')
             
             # Position status items below the status section title
             status_y = status_section_y + self.legend_items_spacing
             
             # Calculate status item widths
             status_item_widths = []
-            for label, _ in status_items:
+            for label, _, _ in status_items:
                 text_width = self.get_text_width(label, font_size=10, font_family="Arial")
                 item_width = 15 + text_width + self.legend_item_padding
                 status_item_widths.append(item_width)
-                logger.info(f"Status item '{label}' width: {text_width}px, total: {item_width}px")
+                logger.debug("Status item '%s' width: %spx, total: %spx", label, text_width, item_width)
             
             # Distribute status items - ensure all status items are included
-            current_x = legend_x
-            current_row_width = 0
+            # (status rows are always 25px apart)
+            status_positions = self.layout_legend_items(status_item_widths, legend_x, status_y,
+                                                        available_legend_width, 25)
             
-            for i, ((label, color), item_width) in enumerate(zip(status_items, status_item_widths)):
-                # Check if this item would exceed the available width
-                if current_x + item_width > legend_x + available_legend_width and i > 0:
-                    # Start a new row
-                    status_y += 25  # Move down 25px for the next row
-                    current_x = legend_x
-                    current_row_width = 0
-                
+            for (label, color, is_circle), (item_x, item_y) in zip(status_items, status_positions):
                 # For status items, use circles instead of rectangles
-                if label.startswith("Port "):
-                    # Draw a circle for port status
-                    circle_x = current_x + 5  # Center of the 10x10 space
-                    circle_y = status_y + 5   # Center of the 10x10 space
-                    svg.append(f'  <circle cx="{circle_x}" cy="{circle_y}" r="5" fill="{color}" stroke="#000000" stroke-width="1" />')
+                if is_circle:
+                    # Draw a circle for port status, centered in the 10x10 space
+                    yield f'  <circle cx="{item_x + 5}" cy="{item_y + 5}" r="5" fill="{color}" stroke="#000000" stroke-width="1" />'
                 else:
                     # Draw a rectangle for VLAN items
-                    svg.append(f'  <rect x="{current_x}" y="{status_y}" width="10" height="10" fill="{color}" stroke="#000000" stroke-width="1" />')
+                    yield f'  <rect x="{item_x}" y="{item_y}" width="10" height="10" fill="{color}" stroke="#000000" stroke-width="1" />'
                 
                 # Draw the text
-                svg.append(f'  <text x="{current_x + 15}" y="{status_y + 9}" font-family="Arial" '
-                          f'font-size="10" fill="{self.theme_colors["text"]}">{label}</text>')
-                
-                # Move to the next item position
-                current_x += item_width
-                current_row_width += item_width
-                
-                # Check if this is the last item and we need to ensure all status items are included
-                if i == len(status_items) - 1:
-                    # Check if we're missing the "Port disabled" status
-                    if not any(item[0] == "Port disabled" for item in status_items):
-                        # Add the "Port disabled" status
-                        disabled_label = "Port disabled"
-                        disabled_color = "#000000"  # Black for DISABLED
-                        disabled_text_width = self.get_text_width(disabled_label, font_size=10, font_family="Arial")
-                        disabled_item_width = 15 + disabled_text_width + self.legend_item_padding
-                        
-                        # Check if this item would exceed the available width
-                        if current_x + disabled_item_width > legend_x + available_legend_width:
-                            # Start a new row
-                            status_y += 25  # Move down 25px for the next row
-                            current_x = legend_x
-                        
-                        # Draw a circle for port disabled status
-                        circle_x = current_x + 5  # Center of the 10x10 space
-                        circle_y = status_y + 5   # Center of the 10x10 space
-                        svg.append(f'  <circle cx="{circle_x}" cy="{circle_y}" r="5" fill="{disabled_color}" stroke="#000000" stroke-width="1" />')
-                        
-                        # Draw the text
-                        svg.append(f'  <text x="{current_x + 15}" y="{status_y + 9}" font-family="Arial" '
-                                  f'font-size="10" fill="{self.theme_colors["text"]}">{disabled_label}</text>')
-                    
-                    # Check if we're missing the "Port down" status
-                    if not any(item[0] == "Port down" for item in status_items):
-                        # Add the "Port down" status
-                        down_label = "Port down"
-                        down_color = "#e74c3c"  # Red for DOWN
-                        down_text_width = self.get_text_width(down_label, font_size=10, font_family="Arial")
-                        down_item_width = 15 + down_text_width + self.legend_item_padding
-                        
-                        # Check if this item would exceed the available width
-                        if current_x + down_item_width > legend_x + available_legend_width:
-                            # Start a new row
-                            status_y += 25  # Move down 25px for the next row
-                            current_x = legend_x
-                        
-                        # Draw a circle for port down status
-                        circle_x = current_x + 5  # Center of the 10x10 space
-                        circle_y = status_y + 5   # Center of the 10x10 space
-                        svg.append(f'  <circle cx="{circle_x}" cy="{circle_y}" r="5" fill="{down_color}" stroke="#000000" stroke-width="1" />')
-                        
-                        # Draw the text
-                        svg.append(f'  <text x="{current_x + 15}" y="{status_y + 9}" font-family="Arial" '
-                                  f'font-size="10" fill="{self.theme_colors["text"]}">{down_label}</text>')
-        
-        return svg
+                yield (f'  <text x="{item_x + 15}" y="{item_y + 9}" font-family="Arial" '
+                      f'font-size="10" fill="{text_color}">{label}</text>')
 
-    def generate_ports(self, adjusted_width: int, ports_per_row: int, num_rows: int) -> List[str]:
+    def generate_ports(self, adjusted_width: int, ports_per_row: int, num_rows: int) -> Iterator[str]:
         """
         Generate the SVG content for the switch ports.
         
@@ -1023,11 +1167,10 @@ class SwitchSVGGenerator:
             ports_per_row: Number of ports per row
             num_rows: Number of rows of ports
             
-        Returns:
-            List of SVG lines for the ports
+        Yields:
+            SVG lines for the ports
         """
-        svg = []
-        svg.append(f'  <!-- Switch ports -->')
+        yield f'  <!-- Switch ports -->'
         
         # Get port shape attributes
         port_shape_attrs = self.get_port_shape_attributes()
@@ -1050,168 +1193,49 @@ class SwitchSVGGenerator:
         
         # Generate regular RJ45 ports (skip in SFP-only mode)
         if not self.sfp_only_mode:
-            row_spacing = 4  # Use the same row spacing as defined in calculate_dimensions
+            # Compute every port position up front so the loop below only builds strings
+            port_positions = self.calculate_port_positions(start_x, start_y)
             
-            # Handle different layout modes
-            if self.layout_mode == LayoutMode.SINGLE_ROW:
-                # Single row layout - all ports in one row
-                for i in range(self.num_ports):
-                    # Make sure we generate exactly num_ports ports, regardless of port_start_number
-                    if i >= self.num_ports:
-                        break
-                    
-                    # Calculate position with port grouping if enabled
-                    if self.port_group_size > 0 and i > 0:
-                        # Calculate which group this port belongs to
-                        group_num = i // self.port_group_size
-                        
-                        # Add extra spacing between groups
-                        extra_spacing = group_num * self.port_group_spacing
-                        
-                        x = start_x + i * (self.port_width + self.port_spacing) + extra_spacing
-                    else:
-                        # Standard spacing without grouping
-                        x = start_x + i * (self.port_width + self.port_spacing)
-                    
-                    # All ports are in a single row
-                    y = start_y
-                    
-                    color = self.get_port_color(port_num)
-                    
-                    # Create port group with tooltip
-                    # Adjust the displayed port number based on port_start_number
-                    display_port_num = i + self.port_start_number
-                    port_label = self.port_labels.get(port_num, str(display_port_num))
-                    status = self.port_status_map.get(port_num, PortStatus.UP)
-                    vlan_id = self.port_vlan_map.get(port_num, 1)
-                    
-                    tooltip = f"Port: {port_num}, Label: {port_label}, Status: {status.value}, VLAN: {vlan_id}"
-                    
-                    svg.append(f'  <g id="port-{port_num}">')
-                    svg.append(f'    <title>{tooltip}</title>')
-                    
-                    # Port rectangle
-                    svg.append(f'    <rect x="{x}" y="{y}" width="{self.port_width}" height="{self.port_height}" '
-                              f'fill="{color}" stroke="#000000" stroke-width="1" '
-                              f'rx="{port_shape_attrs["rx"]}" ry="{port_shape_attrs["ry"]}" />')
-                    
-                    # Port label - centered inside the port rectangle
-                    text_x = x + (self.port_width // 2)
-                    text_y = y + (self.port_height // 2) + 4  # Adjusted to center vertically
-                    svg.append(f'    <text x="{text_x}" y="{text_y}" font-family="Arial" font-size="10" '
-                              f'fill="white" text-anchor="middle" dominant-baseline="middle">{port_label}</text>')
-                    
-                    # Status indicator (small circle in corner if enabled)
-                    if self.show_status_indicator:
-                        indicator_x = x + self.port_width - 5
-                        indicator_y = y + 5
-                        # Use specific colors for each status
-                        if status == PortStatus.UP:
-                            indicator_color = "#2ecc71"  # Green for UP
-                            stroke_color = "#000000"     # Black border
-                        elif status == PortStatus.DOWN:
-                            indicator_color = "#e74c3c"  # Red for DOWN
-                            stroke_color = "#000000"     # Black border
-                        else:  # DISABLED
-                            indicator_color = "#000000"  # Black for DISABLED
-                            stroke_color = "#000000"     # Black border
-                        
-                        svg.append(f'    <circle cx="{indicator_x}" cy="{indicator_y}" r="3" '
-                                  f'fill="{indicator_color}" stroke="{stroke_color}" stroke-width="0.5" />')
-                    
-                    svg.append(f'  </g>')
-                    
-                    port_num += 1
-            else:  # ZIGZAG layout
-                # Calculate how many columns we need
-                # For zigzag pattern, we need twice as many columns
-                ports_per_row = min(self.num_ports, 48)  # Allow up to 48 ports in zigzag (24 per row)
-                num_cols = (self.num_ports + 1) // 2  # Ceiling division for odd number of ports
+            # Bind loop-invariant attributes and lookups to locals once, so the
+            # per-port body below only touches fast local variables
+            UP = PortStatus.UP
+            status_fill = _STATUS_INDICATOR_FILL
+            status_str = _STATUS_STR
+            status_map = self.port_status_map
+            vlan_map = self.port_vlan_map
+            show_status_indicator = self.show_status_indicator
+            indicator_dx = self.port_width - 5
+            
+            # Build all port labels in one comprehension; ports without a custom
+            # label show their number adjusted by port_start_number
+            labels = self.port_labels
+            port_labels = [labels.get(i + 1, str(i + self.port_start_number)) for i in range(self.num_ports)]
+            
+            # Rectangles and labels do not depend on port status, so they are
+            # reused across renders that only change the status map
+            port_bodies = self._emit_port_bodies(port_positions, port_labels, port_shape_attrs)
+            
+            # Both layout modes share the same emit code; only the positions differ
+            for i, (x, y) in enumerate(port_positions):
+                # Create port group with tooltip
+                port_label = port_labels[i]
+                status = status_map.get(port_num, UP)
+                vlan_id = vlan_map.get(port_num, 1)
+                
+                # Port group with tooltip, the cached rectangle and label, and
+                # the status indicator (small circle in corner if enabled)
+                if show_status_indicator:
+                    yield _PORT_BLOCK_IND_TMPL % (port_num, port_num, port_label, status_str[status], vlan_id,
+                                                  port_bodies[i], x + indicator_dx, y + 5, status_fill[status])
+                else:
+                    yield _PORT_BLOCK_TMPL % (port_num, port_num, port_label, status_str[status], vlan_id,
+                                              port_bodies[i])
                 
-                for i in range(self.num_ports):
-                    # Make sure we generate exactly num_ports ports, regardless of port_start_number
-                    if i >= self.num_ports:
-                        break
-                        
-                    # Calculate row and column for zigzag pattern based on zigzag_start_position
-                    if self.zigzag_start_position == "top":
-                        # Even ports (0, 2, 4...) go in row 0 (top), odd ports (1, 3, 5...) go in row 1 (bottom)
-                        row = i % 2
-                    else:  # "bottom"
-                        # Even ports (0, 2, 4...) go in row 1 (bottom), odd ports (1, 3, 5...) go in row 0 (top)
-                        row = (i + 1) % 2
-                    col = i // 2
-                    
-                    # Calculate position with port grouping if enabled
-                    if self.port_group_size > 0 and col > 0:
-                        # Calculate which group this port belongs to
-                        # We need to use column number (not port number) for grouping
-                        # since we're using a zigzag pattern
-                        # For zigzag pattern, each column represents 2 ports, so we need to adjust
-                        # the port_group_size to be half of the actual port_group_size
-                        adjusted_group_size = max(1, self.port_group_size // 2)
-                        group_num = col // adjusted_group_size
-                        
-                        # Add extra spacing between groups
-                        extra_spacing = group_num * self.port_group_spacing
-                        
-                        x = start_x + col * (self.port_width + self.port_spacing) + extra_spacing
-                    else:
-                        # Standard spacing without grouping
-                        x = start_x + col * (self.port_width + self.port_spacing)
-                        
-                    y = start_y + row * (self.port_height + row_spacing)
-                    
-                    color = self.get_port_color(port_num)
-                    
-                    # Create port group with tooltip
-                    # Adjust the displayed port number based on port_start_number
-                    display_port_num = i + self.port_start_number
-                    port_label = self.port_labels.get(port_num, str(display_port_num))
-                    status = self.port_status_map.get(port_num, PortStatus.UP)
-                    vlan_id = self.port_vlan_map.get(port_num, 1)
-                    
-                    tooltip = f"Port: {port_num}, Label: {port_label}, Status: {status.value}, VLAN: {vlan_id}"
-                    
-                    svg.append(f'  <g id="port-{port_num}">') 
-                    svg.append(f'    <title>{tooltip}</title>')
-                    
-                    # Port rectangle
-                    svg.append(f'    <rect x="{x}" y="{y}" width="{self.port_width}" height="{self.port_height}" '
-                              f'fill="{color}" stroke="#000000" stroke-width="1" '
-                              f'rx="{port_shape_attrs["rx"]}" ry="{port_shape_attrs["ry"]}" />')
-                    
-                    # Port label - centered inside the port rectangle
-                    text_x = x + (self.port_width // 2)
-                    text_y = y + (self.port_height // 2) + 4  # Adjusted to center vertically
-                    svg.append(f'    <text x="{text_x}" y="{text_y}" font-family="Arial" font-size="10" '
-                              f'fill="white" text-anchor="middle" dominant-baseline="middle">{port_label}</text>')
-                    
-                    # Status indicator (small circle in corner if enabled)
-                    if self.show_status_indicator:
-                        indicator_x = x + self.port_width - 5
-                        indicator_y = y + 5
-                        # Use specific colors for each status
-                        if status == PortStatus.UP:
-                            indicator_color = "#2ecc71"  # Green for UP
-                            stroke_color = "#000000"     # Black border
-                        elif status == PortStatus.DOWN:
-                            indicator_color = "#e74c3c"  # Red for DOWN
-                            stroke_color = "#000000"     # Black border
-                        else:  # DISABLED
-                            indicator_color = "#000000"  # Black for DISABLED
-                            stroke_color = "#000000"     # Black border
-                        
-                        svg.append(f'    <circle cx="{indicator_x}" cy="{indicator_y}" r="3" '
-                                  f'fill="{indicator_color}" stroke="{stroke_color}" stroke-width="0.5" />')
-                    
-                    svg.append(f'  </g>')
-                    
-                    port_num += 1
+                port_num += 1
         
         # Generate SFP ports if requested
         if self.sfp_ports > 0:
-            svg.append(f'  <!-- SFP Ports -->')
+            yield f'  <!-- SFP Ports -->'
             
             # SFP ports are rotated 90 degrees (wider than tall)
             sfp_height = 20
@@ -1245,219 +1269,233 @@ class SwitchSVGGenerator:
                 # In normal mode, position SFP ports right after the last regular port with sfp_spacing
                 sfp_start_x = last_port_x + self.port_width + sfp_spacing
             
-            # Handle different SFP layouts
-            if self.sfp_layout == "horizontal":
-                # Place all SFP ports in a single horizontal row
-                
-                # Calculate how many groups we have for SFP ports
-                sfp_groups = 1
-                if self.sfp_group_size > 0 and self.sfp_ports > 0:
-                    sfp_groups = (self.sfp_ports + self.sfp_group_size - 1) // self.sfp_group_size
-                
-                # Calculate extra spacing from grouping
-                sfp_extra_spacing = (sfp_groups - 1) * self.port_group_spacing if sfp_groups > 1 else 0
-                
-                # Calculate total width needed for SFP ports
-                sfp_width_needed = (self.sfp_ports * sfp_width) + ((self.sfp_ports - 1) * sfp_port_spacing) + sfp_extra_spacing
-                
-                # Calculate the end position of the SFP ports
-                sfp_end_x = sfp_start_x + sfp_width_needed
-                
-                # Check if this would exceed the available width
-                if sfp_end_x > available_width + 10 - end_spacing:
-                    logger.warning(f"SFP ports would exceed available width. Adjusting switch width.")
-                
-                # Position SFP ports in a single row
-                for i in range(self.sfp_ports):
-                    sfp_num = self.num_ports + i + self.port_start_number
-                    
-                    # Calculate position with SFP port grouping if enabled
-                    if self.sfp_group_size > 0 and i > 0:
-                        # Calculate which group this SFP port belongs to
-                        group_num = i // self.sfp_group_size
-                        
-                        # Add extra spacing between groups
-                        extra_spacing = group_num * self.port_group_spacing
-                        
-                        sfp_x = sfp_start_x + i * (sfp_width + sfp_port_spacing) + extra_spacing
-                    else:
-                        # Standard spacing without grouping
-                        sfp_x = sfp_start_x + i * (sfp_width + sfp_port_spacing)
-                    
-                    # Position SFP ports based on layout mode
-                    if self.layout_mode == LayoutMode.SINGLE_ROW:
-                        # In single row layout, all SFP ports are in the same row as regular ports
-                        sfp_y = start_y
-                    else:
-                        # In zigzag layout, SFP ports are aligned with the bottom row of regular ports
-                        sfp_y = start_y + (self.port_height + 4)  # Align with bottom row
-                    
-                    # Use the VLAN color for the SFP port
-                    sfp_color = self.get_port_color(sfp_num)
-                    
-                    # Create SFP port group with tooltip
-                    sfp_label = self.port_labels.get(sfp_num, f"SFP{i}")
-                    vlan_id = self.port_vlan_map.get(sfp_num, 1)
-                    
-                    tooltip = f"SFP Port: {sfp_num}, Label: {sfp_label}, VLAN: {vlan_id}"
-                    
-                    svg.append(f'  <g id="sfp-{i+1}">')
-                    svg.append(f'    <title>{tooltip}</title>')
-                    
-                    # SFP port rectangle
-                    svg.append(f'    <rect x="{sfp_x}" y="{sfp_y}" width="{sfp_width}" height="{sfp_height}" '
-                              f'fill="{sfp_color}" stroke="#000000" stroke-width="1" rx="2" ry="2" />')
-                    
-                    # SFP port label
-                    svg.append(f'    <text x="{sfp_x + sfp_width/2}" y="{sfp_y + sfp_height/2 + 4}" '
-                              f'font-family="Arial" font-size="10" fill="white" '
-                              f'text-anchor="middle" dominant-baseline="middle">{sfp_label}</text>')
-                    
-                    # Add status indicator for SFP ports too
-                    if self.show_status_indicator:
-                        # Get the status for this SFP port
-                        sfp_status = self.port_status_map.get(sfp_num, PortStatus.UP)
-                        indicator_x = sfp_x + sfp_width - 5
-                        indicator_y = sfp_y + 5
-                        
-                        # Always show status indicator regardless of status
-                        svg.append(f'    <circle cx="{indicator_x}" cy="{indicator_y}" r="3" '
-                                  f'fill="{self.STATUS_COLORS[sfp_status]}" stroke="white" stroke-width="0.5" />')
-                    
-                    # Close the SFP port group
-                    svg.append(f'  </g>')
-                
-            else:  # Default to zigzag layout
-                # Place SFP ports in a zigzag pattern (similar to regular ports)
-                
-                # Calculate how many columns we need for SFP ports
-                sfp_cols = (self.sfp_ports + 1) // 2  # Ceiling division for odd number of SFP ports
-                
-                # Calculate how many groups we have for SFP ports
-                sfp_groups = 1
-                if self.sfp_group_size > 0 and sfp_cols > 0:
-                    sfp_groups = (sfp_cols + self.sfp_group_size - 1) // self.sfp_group_size
-                
-                # Calculate extra spacing from grouping
-                sfp_extra_spacing = (sfp_groups - 1) * self.port_group_spacing if sfp_groups > 1 else 0
-                
-                # Calculate total width needed for SFP ports
-                sfp_width_needed = (sfp_cols * sfp_width) + ((sfp_cols - 1) * sfp_port_spacing) + sfp_extra_spacing
-                
-                # Calculate the end position of the SFP ports
-                sfp_end_x = sfp_start_x + sfp_width_needed
-                
-                # Check if this would exceed the available width
-                if sfp_end_x > available_width + 10 - end_spacing:
-                    logger.warning(f"SFP ports would exceed available width. Adjusting switch width.")
+            # Check whether the SFP block would overflow the switch body
+            # (sfp_ports > 0 here, so there is at least one column; every group
+            # after the first adds port_group_spacing)
+            sfp_cols = self.sfp_ports if self.sfp_layout == "horizontal" else (self.sfp_ports + 1) // 2
+            sfp_group_size = self.sfp_group_size if self.sfp_group_size > 0 else sfp_cols
+            sfp_extra_spacing = ((sfp_cols - 1) // sfp_group_size) * self.port_group_spacing
+            sfp_width_needed = (sfp_cols * sfp_width) + ((sfp_cols - 1) * sfp_port_spacing) + sfp_extra_spacing
+            if sfp_start_x + sfp_width_needed > available_width + 10 - end_spacing:
+                logger.warning("SFP ports would exceed available width. Adjusting switch width.")
+            
+            # Compute every SFP position up front, same as for the regular ports
+            sfp_positions = self.calculate_sfp_positions(sfp_start_x, start_y, sfp_width, sfp_port_spacing)
+            
+            # Resolve every per-port value into its own list up front, so the
+            # emit loop below only indexes lists instead of probing the maps
+            first_sfp_num = self.num_ports + self.port_start_number
+            sfp_nums = range(first_sfp_num, first_sfp_num + self.sfp_ports)
+            sfp_colors = [self.get_port_color(n) for n in sfp_nums]
+            vlan_map = self.port_vlan_map
+            sfp_vlans = [vlan_map.get(n, 1) for n in sfp_nums]
+            
+            # Default labels are only formatted when no custom label is set. The
+            # horizontal layout numbers them from 0, zigzag from port_start_number
+            labels = self.port_labels
+            label_offset = 0 if self.sfp_layout == "horizontal" else self.port_start_number
+            sfp_labels = [labels[n] if n in labels else f"SFP{i + label_offset}"
+                          for i, n in enumerate(sfp_nums)]
+            
+            show_status_indicator = self.show_status_indicator
+            if show_status_indicator:
+                # Ports without an explicit status are up; use that fill directly
+                status_colors = self.STATUS_COLORS
+                status_map = self.port_status_map
+                up_color = status_colors[PortStatus.UP]
+                sfp_indicator_fills = [status_colors[status_map[n]] if n in status_map else up_color
+                                       for n in sfp_nums]
+            
+            half_width = sfp_width // 2
+            label_dy = sfp_height // 2 + 4
+            indicator_dx = sfp_width - 5
+            
+            # Both SFP layouts share the same emit code; only the positions differ
+            for i, (sfp_x, sfp_y) in enumerate(sfp_positions):
+                sfp_label = sfp_labels[i]
                 
-                # Position SFP ports in a zigzag pattern
-                for i in range(self.sfp_ports):
-                    sfp_num = self.num_ports + i + self.port_start_number
-                    
-                    # Calculate row and column for zigzag pattern based on zigzag_start_position
-                    if self.zigzag_start_position == "top":
-                        # Even ports (0, 2, 4...) go in row 0 (top), odd ports (1, 3, 5...) go in row 1 (bottom)
-                        row = i % 2
-                    else:  # "bottom"
-                        # Even ports (0, 2, 4...) go in row 1 (bottom), odd ports (1, 3, 5...) go in row 0 (top)
-                        row = (i + 1) % 2
-                    col = i // 2
-                    
-                    # Calculate position with SFP port grouping if enabled
-                    if self.sfp_group_size > 0 and col > 0:
-                        # Calculate which group this SFP port belongs to
-                        group_num = col // self.sfp_group_size
-                        
-                        # Add extra spacing between groups
-                        extra_spacing = group_num * self.port_group_spacing
-                        
-                        sfp_x = sfp_start_x + col * (sfp_width + sfp_port_spacing) + extra_spacing
-                    else:
-                        # Standard spacing without grouping
-                        sfp_x = sfp_start_x + col * (sfp_width + sfp_port_spacing)
-                    
-                    # Position SFP ports based on layout mode
-                    if self.layout_mode == LayoutMode.SINGLE_ROW:
-                        # In single row layout, all SFP ports are in the same row
-                        sfp_y = start_y
-                    else:
-                        # In zigzag layout, position SFP ports vertically aligned with regular ports
-                        sfp_y = start_y + row * (self.port_height + 4)  # 4px spacing between rows
-                    
-                    # Use the VLAN color for the SFP port
-                    sfp_color = self.get_port_color(sfp_num)
-                    
-                    # Create SFP port group with tooltip
-                    # Adjust the displayed SFP port number based on port_start_number
-                    display_sfp_num = i + self.port_start_number
-                    sfp_label = self.port_labels.get(sfp_num, f"SFP{display_sfp_num}")
-                    vlan_id = self.port_vlan_map.get(sfp_num, 1)
-                    
-                    tooltip = f"SFP Port: {sfp_num}, Label: {sfp_label}, VLAN: {vlan_id}"
-                    
-                    svg.append(f'  <g id="sfp-{i+1}">')
-                    svg.append(f'    <title>{tooltip}</title>')
-                    
-                    # SFP port rectangle
-                    svg.append(f'    <rect x="{sfp_x}" y="{sfp_y}" width="{sfp_width}" height="{sfp_height}" '
-                              f'fill="{sfp_color}" stroke="#000000" stroke-width="1" rx="2" ry="2" />')
-                    
-                    # SFP port label
-                    svg.append(f'    <text x="{sfp_x + sfp_width/2}" y="{sfp_y + sfp_height/2 + 4}" '
-                              f'font-family="Arial" font-size="10" fill="white" '
-                              f'text-anchor="middle" dominant-baseline="middle">{sfp_label}</text>')
-                    
-                    # Add status indicator for SFP ports too
-                    if self.show_status_indicator:
-                        # Get the status for this SFP port
-                        sfp_status = self.port_status_map.get(sfp_num, PortStatus.UP)
-                        indicator_x = sfp_x + sfp_width - 5
-                        indicator_y = sfp_y + 5
-                        
-                        # Always show status indicator regardless of status
-                        svg.append(f'    <circle cx="{indicator_x}" cy="{indicator_y}" r="3" '
-                                  f'fill="{self.STATUS_COLORS[sfp_status]}" stroke="white" stroke-width="0.5" />')
-                    
-                    # Close the SFP port group
-                    svg.append(f'  </g>')
-        return svg
+                # SFP port group with tooltip, the rectangle in the VLAN color,
+                # the label and, if enabled, the status indicator
+                fields = (i + 1, sfp_nums[i], sfp_label, sfp_vlans[i],
+                          sfp_x, sfp_y, sfp_width, sfp_height, sfp_colors[i],
+                          sfp_x + half_width, sfp_y + label_dy, sfp_label)
+                if show_status_indicator:
+                    # Always show status indicator regardless of status
+                    yield _SFP_BLOCK_IND_TMPL % (fields + (sfp_x + indicator_dx, sfp_y + 5, sfp_indicator_fills[i]))
+                else:
+                    yield _SFP_BLOCK_TMPL % fields
+
+    def _emit_port_bodies(self, port_positions: List[Tuple[int, int]], port_labels: List[str],
+                          port_shape_attrs: Dict[str, Union[int, str]]) -> List[str]:
+        """
+        Get the rectangle and label markup of every regular port.
+        
+        The result is cached on everything it depends on except the port
+        status map, which only affects tooltips and status indicators.
+        
+        Args:
+            port_positions: (x, y) position of every regular port
+            port_labels: Display label of every regular port
+            port_shape_attrs: Port corner radii from get_port_shape_attributes()
+            
+        Returns:
+            List of rect and text lines joined by a newline, one per regular port
+        """
+        cache = SwitchSVGGenerator._PORT_BODY_CACHE
+        key = (
+            type(self),
+            tuple(port_positions),
+            tuple(port_labels),
+            self.port_width,
+            self.port_height,
+            port_shape_attrs["rx"],
+            port_shape_attrs["ry"],
+            tuple(_sorted_items(self.port_vlan_map)),
+            tuple(_sorted_items(self.vlan_colors)),
+        )
+        with self._CACHE_LOCK:
+            bodies = cache.get(key)
+            if bodies is not None:
+                cache.move_to_end(key)
+                return bodies
+        
+        get_color = self.get_port_color
+        pw = self.port_width
+        ph = self.port_height
+        rx = port_shape_attrs["rx"]
+        ry = port_shape_attrs["ry"]
+        
+        # Port label offsets - centered inside the port rectangle
+        text_dx = pw // 2
+        text_dy = ph // 2 + 4  # Adjusted to center vertically
+        
+        body_tmpl = _PORT_RECT_TMPL + '\n' + _PORT_TEXT_TMPL
+        bodies = [body_tmpl % (x, y, pw, ph, get_color(port_num), rx, ry, x + text_dx, y + text_dy, port_label)
+                  for port_num, ((x, y), port_label) in enumerate(zip(port_positions, port_labels), start=1)]
+        
+        with self._CACHE_LOCK:
+            cache[key] = bodies
+            if len(cache) > self._SVG_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        return bodies
+
+    @classmethod
+    def clear_svg_cache(cls) -> None:
+        """
+        Drop every cached rendering, including the cached port bodies.
+        """
+        with cls._CACHE_LOCK:
+            SwitchSVGGenerator._SVG_CACHE.clear()
+            SwitchSVGGenerator._PORT_BODY_CACHE.clear()
+
+    def get_svg_cache_key(self) -> bytes:
+        """
+        Get a digest of every input that influences the rendered SVG.
+        
+        Dictionaries are flattened to sorted item lists so that equal
+        configurations produce equal keys regardless of insertion order.
+        The concrete class is part of the key because subclasses may
+        override individual generate_* methods.
+        
+        Returns:
+            16-byte BLAKE2b digest of the generator state
+        """
+        # Collect slot attributes from the whole class hierarchy, plus any
+        # attributes callers or subclasses stored in the instance __dict__
+        attrs = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name != '__dict__' and hasattr(self, name):
+                    attrs[name] = getattr(self, name)
+        attrs.update(getattr(self, '__dict__', {}))
+        
+        state = [type(self).__module__, type(self).__qualname__]
+        for name, value in sorted(attrs.items()):
+            if name in self._SVG_CACHE_IGNORED_ATTRS:
+                continue
+            if isinstance(value, dict):
+                value = _sorted_items(value)
+            state.append((name, value))
+        return hashlib.blake2b(repr(state).encode(), digest_size=16).digest()
 
     def generate_svg(self) -> str:
         """
         Generate the complete SVG content for the switch.
         
+        Identical configurations are served from a bounded class-level cache
+        instead of being rendered again.
+        
+        Returns:
+            SVG content as a string
+        """
+        cache = SwitchSVGGenerator._SVG_CACHE
+        key = self.get_svg_cache_key()
+        with self._CACHE_LOCK:
+            svg_content = cache.get(key)
+            if svg_content is not None:
+                cache.move_to_end(key)
+                return svg_content
+        
+        svg_content = self.render_svg()
+        with self._CACHE_LOCK:
+            cache[key] = svg_content
+            if len(cache) > self._SVG_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        return svg_content
+
+    def render_svg(self) -> str:
+        """
+        Render the complete SVG content for the switch, bypassing the cache.
+        
         Returns:
             SVG content as a string
         """
+        buf = io.StringIO()
+        self.write_svg(buf)
+        return buf.getvalue()
+
+    def write_svg(self, fp: TextIO) -> None:
+        """
+        Render the complete SVG content for the switch into a text stream.
+        
+        Every section is written as soon as it is generated, so the full
+        document never has to be held in memory.
+        
+        Args:
+            fp: Writable text stream, such as an open file or io.StringIO
+        """
         # Calculate dimensions
         adjusted_width, adjusted_height, ports_per_row, num_rows = self.calculate_dimensions()
         
-        # Build SVG content in sections
-        svg = []
+        write = fp.write
+        
+        def write_section(lines: Iterable[str]) -> None:
+            # One write per section: str.join does the per-line work in C
+            section = '\n'.join(lines)
+            if section:
+                write(section)
+                write('\n')
         
         # Header
-        svg.extend(self.generate_svg_header(adjusted_width, adjusted_height))
+        write_section(self.generate_svg_header(adjusted_width, adjusted_height))
         
         # Switch body
-        svg.extend(self.generate_switch_body(adjusted_width, adjusted_height))
+        write_section(self.generate_switch_body(adjusted_width, adjusted_height))
         
         # Switch details
-        svg.extend(self.generate_switch_details(adjusted_width))
+        write_section(self.generate_switch_details(adjusted_width))
         
         # Status indicators
-        svg.extend(self.generate_status_indicators(adjusted_width))
+        write_section(self.generate_status_indicators(adjusted_width))
         
         # Ports
-        svg.extend(self.generate_ports(adjusted_width, ports_per_row, num_rows))
+        write_section(self.generate_ports(adjusted_width, ports_per_row, num_rows))
         
         # Legend
-        svg.extend(self.generate_legend(adjusted_width, adjusted_height))
+        write_section(self.generate_legend(adjusted_width, adjusted_height))
         
         # Close SVG
-        svg.append('</svg>')
-        
-        return '\n'.join(svg)
+        write('</svg>')
 
     def save_svg(self) -> None:
         """
@@ -1466,28 +1504,21 @@ class SwitchSVGGenerator:
         Raises:
             IOError: If there's an error writing to the output file
         """
+        # Render the whole document (or take it from the cache) before the file
+        # is opened, so a rendering error leaves any existing output untouched
         svg_content = self.generate_svg()
         
-        # Fix any issues with angle brackets in the SVG content
-        # Check if the XML declaration and SVG opening tag have angle brackets
-        if not svg_content.startswith('<?xml'):
-            # If it starts with 'xml' without the opening angle bracket, add it
-            if svg_content.startswith('xml'):
-                svg_content = '<' + svg_content
-        
-        # Check if the SVG tag is missing its opening angle bracket
-        # Look for 'svg width=' without the opening angle bracket
-        if 'svg width="' in svg_content and '<svg width="' not in svg_content:
-            # Add the opening angle bracket before 'svg'
-            svg_content = svg_content.replace('svg width="', '<svg width="', 1)
-        
-        # Check for double angle brackets (<<svg)
-        if '<<svg' in svg_content:
-            # Replace <<svg with <svg
-            svg_content = svg_content.replace('<<svg', '<svg', 1)
+        # Skip the write if the file already holds exactly this document
+        try:
+            with open(self.output_file, 'r', encoding='utf-8', newline='') as f:
+                if f.read(len(svg_content) + 1) == svg_content:
+                    logger.info(f"SVG switch diagram {self.output_file} is up to date")
+                    return
+        except (OSError, UnicodeDecodeError):
+            pass
         
         try:
-            with open(self.output_file, 'w') as f:
+            with open(self.output_file, 'w', encoding='utf-8', newline='') as f:
                 f.write(svg_content)
             
             logger.info(f"SVG switch diagram saved to {self.output_file}")
@@ -1502,6 +1533,9 @@ class SwitchSVGGenerator:
         Raises:
             IOError: If there's an error writing to the output file
         """
+        # Only previews need a browser; webbrowser pulls in subprocess on import
+        import webbrowser
+        
         self.save_svg()
         
         try:
@@ -0,0 +1,14 @@
+"""
+Pytest configuration for the switch SVG generator tests.
+
+Puts the project root on the import path once per session, so test modules
+can import the ``src`` package however pytest is invoked.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -8,121 +8,75 @@ width scales appropriately and maintains consistent spacing.
 import os
 import sys
 import unittest
+import xml.etree.ElementTree as ET
+from collections import Counter
 
 # Add the parent directory to the path so we can import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme, PortStatus
 
+# Namespace of the elements in the generated SVG
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def count_groups(root):
+    """Count the <g> elements by id prefix ("port", "sfp") in a single pass."""
+    return Counter(g.get("id", "").split("-", 1)[0] for g in root.iter(SVG_NS + "g"))
+
+
 class TestDynamicSwitchBody(unittest.TestCase):
     """Test cases for dynamic switch body functionality."""
 
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
         # Create output directory if it doesn't exist
         os.makedirs("output", exist_ok=True)
 
-    def test_minimum_configuration(self):
-        """Test the minimum configuration (5 regular ports, 1 SFP port)."""
-        # Create a switch with minimum configuration
+    def check_configuration(self, num_ports, sfp_ports, switch_name, output_file, min_width, max_width):
+        """Generate a switch and check its port counts and overall width."""
         generator = SwitchSVGGenerator(
-            num_ports=5,
-            sfp_ports=1,
-            switch_name="Minimum Configuration",
-            output_file="output/min_config_switch.svg"
+            num_ports=num_ports,
+            sfp_ports=sfp_ports,
+            switch_name=switch_name,
+            output_file=output_file
         )
         
         # Generate the SVG
         generator.save_svg()
         
         # Verify the file was created
-        self.assertTrue(os.path.exists("output/min_config_switch.svg"))
+        self.assertTrue(os.path.exists(output_file))
+        
+        # Verify the SVG content, parsed once into an element tree
+        root = ET.parse(output_file).getroot()
+        
+        # Check that the SVG contains the correct number of ports
+        counts = count_groups(root)
+        self.assertEqual(counts["port"], num_ports)
+        self.assertEqual(counts["sfp"], sfp_ports)
         
-        # Verify the SVG content
-        with open("output/min_config_switch.svg", "r") as f:
-            svg_content = f.read()
-            
-            # Check that the SVG contains the correct number of ports
-            self.assertEqual(svg_content.count('<g id="port-'), 5)
-            self.assertEqual(svg_content.count('<g id="sfp-'), 1)
-            
-            # Check that the switch body width is appropriate
-            # The width should be calculated based on the number of ports
-            # For 5 ports, we expect a width of around 400-500px
-            width_match = svg_content.find('width="')
-            if width_match != -1:
-                width_start = width_match + 7
-                width_end = svg_content.find('"', width_start)
-                width = int(svg_content[width_start:width_end])
-                self.assertTrue(400 <= width <= 500, f"Expected width between 400-500px, got {width}px")
+        # Check that the switch body width is appropriate
+        # The width should be calculated based on the number of ports
+        width = int(root.get("width"))
+        self.assertTrue(min_width <= width <= max_width,
+                        f"Expected width between {min_width}-{max_width}px, got {width}px")
+
+    def test_minimum_configuration(self):
+        """Test the minimum configuration (5 regular ports, 1 SFP port)."""
+        # For 5 ports, we expect a width of around 400-500px
+        self.check_configuration(5, 1, "Minimum Configuration", "output/min_config_switch.svg", 400, 500)
 
     def test_maximum_configuration(self):
         """Test the maximum configuration (48 regular ports, 6 SFP ports)."""
-        # Create a switch with maximum configuration
-        generator = SwitchSVGGenerator(
-            num_ports=48,
-            sfp_ports=6,
-            switch_name="Maximum Configuration",
-            output_file="output/max_config_switch.svg"
-        )
-        
-        # Generate the SVG
-        generator.save_svg()
-        
-        # Verify the file was created
-        self.assertTrue(os.path.exists("output/max_config_switch.svg"))
-        
-        # Verify the SVG content
-        with open("output/max_config_switch.svg", "r") as f:
-            svg_content = f.read()
-            
-            # Check that the SVG contains the correct number of ports
-            self.assertEqual(svg_content.count('<g id="port-'), 48)
-            self.assertEqual(svg_content.count('<g id="sfp-'), 6)
-            
-            # Check that the switch body width is appropriate
-            # The width should be calculated based on the number of ports
-            # For 48 ports, we expect a width of around 1000-1500px
-            width_match = svg_content.find('width="')
-            if width_match != -1:
-                width_start = width_match + 7
-                width_end = svg_content.find('"', width_start)
-                width = int(svg_content[width_start:width_end])
-                self.assertTrue(1000 <= width <= 1500, f"Expected width between 1000-1500px, got {width}px")
+        # For 48 ports, we expect a width of around 1000-1500px
+        self.check_configuration(48, 6, "Maximum Configuration", "output/max_config_switch.svg", 1000, 1500)
 
     def test_medium_configuration(self):
         """Test a medium configuration (24 regular ports, 4 SFP ports)."""
-        # Create a switch with medium configuration
-        generator = SwitchSVGGenerator(
-            num_ports=24,
-            sfp_ports=4,
-            switch_name="Medium Configuration",
-            output_file="output/med_config_switch.svg"
-        )
-        
-        # Generate the SVG
-        generator.save_svg()
-        
-        # Verify the file was created
-        self.assertTrue(os.path.exists("output/med_config_switch.svg"))
-        
-        # Verify the SVG content
-        with open("output/med_config_switch.svg", "r") as f:
-            svg_content = f.read()
-            
-            # Check that the SVG contains the correct number of ports
-            self.assertEqual(svg_content.count('<g id="port-'), 24)
-            self.assertEqual(svg_content.count('<g id="sfp-'), 4)
-            
-            # Check that the switch body width is appropriate
-            # The width should be calculated based on the number of ports
-            # For 24 ports, we expect a width of around 700-900px
-            width_match = svg_content.find('width="')
-            if width_match != -1:
-                width_start = width_match + 7
-                width_end = svg_content.find('"', width_start)
-                width = int(svg_content[width_start:width_end])
-                self.assertTrue(700 <= width <= 900, f"Expected width between 700-900px, got {width}px")
+        # For 24 ports, we expect a width of around 700-900px
+        self.check_configuration(24, 4, "Medium Configuration", "output/med_config_switch.svg", 700, 900)
 
     def test_edge_spacing(self):
         """Test that the spacing from the edges is exactly 30px."""
@@ -140,44 +94,28 @@ class TestDynamicSwitchBody(unittest.TestCase):
         # Verify the file was created
         self.assertTrue(os.path.exists("output/edge_spacing_switch.svg"))
         
-        # Verify the SVG content
-        with open("output/edge_spacing_switch.svg", "r") as f:
-            svg_content = f.read()
-            
-            # Check that the first port starts at x=30
-            first_port_x = svg_content.find('<rect x="30"')
-            self.assertNotEqual(first_port_x, -1, "First port should start at x=30")
-            
-            # Check that the last SFP port ends at 30px from the right edge
-            # This is harder to verify from the SVG content directly
-            # We'll check that the SFP ports are positioned correctly
-            width_match = svg_content.find('width="')
-            if width_match != -1:
-                width_start = width_match + 7
-                width_end = svg_content.find('"', width_start)
-                total_width = int(svg_content[width_start:width_end])
-                
-                # Find the last SFP port
-                last_sfp_match = svg_content.rfind('<g id="sfp-')
-                if last_sfp_match != -1:
-                    # Find the x position of the last SFP port
-                    rect_match = svg_content.find('<rect x="', last_sfp_match)
-                    if rect_match != -1:
-                        x_start = rect_match + 9
-                        x_end = svg_content.find('"', x_start)
-                        sfp_x = float(svg_content[x_start:x_end])
-                        
-                        # Find the width of the SFP port
-                        width_match = svg_content.find('width="', rect_match)
-                        if width_match != -1:
-                            width_start = width_match + 7
-                            width_end = svg_content.find('"', width_start)
-                            sfp_width = float(svg_content[width_start:width_end])
-                            
-                            # Calculate the distance from the right edge
-                            distance_from_right = total_width - (sfp_x + sfp_width) - 10  # -10 for the margin
-                            self.assertAlmostEqual(distance_from_right, 30, delta=1, 
-                                                  msg=f"Expected 30px from right edge, got {distance_from_right}px")
+        # Verify the SVG content, parsed once into an element tree
+        root = ET.parse("output/edge_spacing_switch.svg").getroot()
+        
+        # Check that the first port starts at x=30
+        self.assertTrue(any(rect.get("x") == "30" for rect in root.iter(SVG_NS + "rect")),
+                        "First port should start at x=30")
+        
+        # Check that the last SFP port ends at 30px from the right edge
+        # We'll check that the SFP ports are positioned correctly
+        total_width = int(root.get("width"))
+        
+        # Find the last SFP port and its rectangle
+        sfp_groups = [g for g in root.iter(SVG_NS + "g") if g.get("id", "").startswith("sfp-")]
+        self.assertTrue(sfp_groups, "No SFP ports found")
+        sfp_rect = sfp_groups[-1].find(SVG_NS + "rect")
+        sfp_x = float(sfp_rect.get("x"))
+        sfp_width = float(sfp_rect.get("width"))
+        
+        # Calculate the distance from the right edge
+        distance_from_right = total_width - (sfp_x + sfp_width) - 10  # -10 for the margin
+        self.assertAlmostEqual(distance_from_right, 30, delta=1, 
+                              msg=f"Expected 30px from right edge, got {distance_from_right}px")
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,20 +7,8 @@ This script generates switches of different sizes and calculates the spacing on
 import os
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme
 
-def calculate_spacing(num_ports):
-    """Calculate the spacing on both sides of the switch."""
-    # Create a switch with the specified number of ports
-    generator = SwitchSVGGenerator(
-        num_ports=num_ports,
-        switch_model=SwitchModel.ENTERPRISE,
-        switch_name=f"{num_ports}-Port Switch",
-        theme=Theme.DARK,
-        output_file=f"output/{num_ports}_port_switch.svg"
-    )
-    
-    # Calculate dimensions
-    adjusted_width, adjusted_height, ports_per_row, num_rows = generator.calculate_dimensions()
-    
+def spacing_kernel(num_ports, port_width, port_spacing, port_group_size, port_group_spacing, body_width):
+    """Calculate the left and right spacing from scalar switch dimensions."""
     # Calculate the position of the first port
     start_spacing = 30  # Space from start of switch to first port
     left_spacing = start_spacing - 10  # 10px is the left margin of the switch body
@@ -28,24 +16,44 @@ def calculate_spacing(num_ports):
     # Calculate the position of the last port
     regular_port_columns = (num_ports + 1) // 2  # Ceiling division for odd number of ports
     
-    # For port grouping, we need to account for extra spacing
+    # For port grouping, we need to account for extra spacing between groups
     port_grouping_extra_width = 0
-    if generator.port_group_size > 0 and regular_port_columns > 0:
-        # Calculate how many groups we have
-        num_groups = (regular_port_columns + generator.port_group_size - 1) // generator.port_group_size
-        # Calculate extra spacing from grouping
-        port_grouping_extra_width = (num_groups - 1) * generator.port_group_spacing if num_groups > 1 else 0
+    if port_group_size > 0 and regular_port_columns > 0:
+        port_grouping_extra_width = ((regular_port_columns - 1) // port_group_size) * port_group_spacing
     
     # Calculate the position of the last port
-    last_port_x = start_spacing + (regular_port_columns - 1) * (generator.port_width + generator.port_spacing) + port_grouping_extra_width
-    last_port_width = generator.port_width
+    last_port_x = start_spacing + (regular_port_columns - 1) * (port_width + port_spacing) + port_grouping_extra_width
     
     # Calculate the right spacing
-    body_width = generator.body_width  # Use the body_width calculated in calculate_dimensions
-    right_spacing = (10 + body_width) - (last_port_x + last_port_width)
+    right_spacing = (10 + body_width) - (last_port_x + port_width)
     
     return left_spacing, right_spacing
 
+def switch_dimensions(num_ports):
+    """Get the port and body dimensions of a switch without saving an SVG."""
+    # Create a switch with the specified number of ports
+    generator = SwitchSVGGenerator(
+        num_ports=num_ports,
+        switch_model=SwitchModel.ENTERPRISE,
+        switch_name=f"{num_ports}-Port Switch",
+        theme=Theme.DARK,
+    )
+    
+    # Calculate dimensions (this sets the body_width used below)
+    generator.calculate_dimensions()
+    
+    return (
+        generator.port_width,
+        generator.port_spacing,
+        generator.port_group_size,
+        generator.port_group_spacing,
+        generator.body_width,
+    )
+
+def calculate_spacing(num_ports):
+    """Calculate the spacing on both sides of the switch."""
+    return spacing_kernel(num_ports, *switch_dimensions(num_ports))
+
 def main():
     """Test the spacing for switches of different sizes."""
     # Create output directory if it doesn't exist
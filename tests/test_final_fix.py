@@ -5,7 +5,6 @@ This script generates a switch with the fixed code and displays it in a browser.
 """
 
 import os
-import webbrowser
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme
 
 # Create output directory if it doesn't exist
@@ -108,11 +107,15 @@ with open("output/fixed_switch_spacing.html", "w") as f:
     f.write(html_content)
 print("Created HTML file at: output/fixed_switch_spacing.html")
 
-# Open the HTML file in the default web browser
-try:
+# Open the HTML file in the default web browser, but only when run as a script
+# so that automated test runs never launch a browser
+if __name__ == "__main__":
+    import webbrowser
+    
     html_path = os.path.abspath("output/fixed_switch_spacing.html")
-    print(f"Opening {html_path} in web browser...")
-    webbrowser.open(f"file://{html_path}")
-except Exception as e:
-    print(f"Error opening HTML file: {e}")
-    print(f"Please open {html_path} manually in your web browser.")
+    try:
+        print(f"Opening {html_path} in web browser...")
+        webbrowser.open(f"file://{html_path}")
+    except Exception as e:
+        print(f"Error opening HTML file: {e}")
+        print(f"Please open {html_path} manually in your web browser.")
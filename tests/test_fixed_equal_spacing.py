@@ -5,7 +5,6 @@ This script generates switches of different sizes and saves them to the output d
 """
 
 import os
-import webbrowser
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme, PortStatus
 
 def generate_switch(num_ports, output_file):
@@ -24,11 +23,8 @@ def generate_switch(num_ports, output_file):
     
     return output_file
 
-def create_html_comparison(output_files):
-    """Create an HTML file to compare the switches."""
-    html_file = "output/equal_spacing_comparison.html"
-    
-    html_content = """
+# Static parts of the comparison page
+_HTML_HEADER = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -45,25 +41,31 @@ def create_html_comparison(output_files):
         <h1>Switch Equal Spacing Comparison</h1>
         <p>This page shows switches of different sizes with equal spacing on both sides.</p>
     """
+
+_HTML_FOOTER = """
+    </body>
+    </html>
+    """
+
+def create_html_comparison(output_files):
+    """Create an HTML file to compare the switches."""
+    html_file = "output/equal_spacing_comparison.html"
     
+    parts = [_HTML_HEADER]
     for file in output_files:
         switch_name = os.path.basename(file).replace(".svg", "")
-        html_content += f"""
+        parts.append(f"""
         <div class="switch-container">
             <div class="switch-title">{switch_name}</div>
             <div class="switch-image">
                 <img src="{file}" alt="{switch_name}" />
             </div>
         </div>
-        """
-    
-    html_content += """
-    </body>
-    </html>
-    """
+        """)
+    parts.append(_HTML_FOOTER)
     
     with open(html_file, "w") as f:
-        f.write(html_content)
+        f.write("".join(parts))
     
     return html_file
 
@@ -90,6 +92,7 @@ def main():
     print(f"\nCreated comparison HTML file: {html_file}")
     
     # Open the HTML file in the default web browser
+    import webbrowser
     try:
         abs_path = os.path.abspath(html_file)
         file_url = f"file://{abs_path}"
@@ -5,7 +5,9 @@ This script tests that legend items wrap to multiple rows when they exceed the s
 """
 
 import os
+import re
 import sys
+import tempfile
 import unittest
 
 # Add the parent directory to the path so we can import the module
@@ -13,30 +15,54 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme, PortStatus
 
+# Pattern capturing the x and y coordinates of every rectangle in the SVG
+_RECT_RE = re.compile(rb'<rect x="([^"]*)" y="([^"]*)"')
+
+# Comment the generator emits at the start of the legend section
+_LEGEND_MARKER = b'<!-- Legend -->'
+
+
+def scan_legend_rects(svg_content):
+    """
+    Scan the legend section of the SVG once for rectangles.
+
+    Returns the number of rectangles and the set of y-coordinates of those
+    placed at whole-pixel x and y positions. Port rectangles in the switch
+    body come before the legend marker and are not scanned.
+    """
+    legend_start = max(svg_content.find(_LEGEND_MARKER), 0)
+    rects = _RECT_RE.findall(svg_content, legend_start)
+    y_coords = {y.decode() for x, y in rects if x.isdigit() and y.isdigit()}
+    return len(rects), y_coords
+
+
 class TestMultiRowLegend(unittest.TestCase):
     """Test cases for multi-row legend functionality."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create output directory if it doesn't exist
-        os.makedirs("output", exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary output directory shared by all tests."""
+        cls._tmp_dir = tempfile.TemporaryDirectory()
+        cls.output_dir = cls._tmp_dir.name
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary output directory."""
+        cls._tmp_dir.cleanup()
 
     def test_many_vlans(self):
         """Test that legend items wrap to multiple rows when there are many VLANs."""
+        output_file = os.path.join(self.output_dir, "many_vlans_switch.svg")
+        
         # Create a switch with many VLANs
         # We'll create a port-VLAN map with 15 different VLANs
-        port_vlan_map = {}
-        for i in range(1, 16):
-            port_vlan_map[i] = i * 10  # VLANs 10, 20, 30, ..., 150
-        
-        # Create custom VLAN colors
-        vlan_colors = {}
-        for vlan_id in port_vlan_map.values():
-            # Generate a color based on the VLAN ID
-            r = (vlan_id * 13) % 256
-            g = (vlan_id * 17) % 256
-            b = (vlan_id * 23) % 256
-            vlan_colors[vlan_id] = f"#{r:02x}{g:02x}{b:02x}"
+        port_vlan_map = {i: i * 10 for i in range(1, 16)}  # VLANs 10, 20, 30, ..., 150
+        
+        # Create custom VLAN colors, generated from the VLAN ID
+        vlan_colors = {
+            vlan_id: f"#{vlan_id * 13 % 256:02x}{vlan_id * 17 % 256:02x}{vlan_id * 23 % 256:02x}"
+            for vlan_id in port_vlan_map.values()
+        }
         
         # Create a switch with many VLANs
         generator = SwitchSVGGenerator(
@@ -45,31 +71,28 @@ class TestMultiRowLegend(unittest.TestCase):
             switch_name="Many VLANs Test",
             port_vlan_map=port_vlan_map,
             vlan_colors=vlan_colors,
-            output_file="output/many_vlans_switch.svg"
+            output_file=output_file
         )
         
         # Generate the SVG
         generator.save_svg()
         
         # Verify the file was created
-        self.assertTrue(os.path.exists("output/many_vlans_switch.svg"))
+        self.assertTrue(os.path.exists(output_file))
         
         # Verify the SVG content
-        with open("output/many_vlans_switch.svg", "r") as f:
+        with open(output_file, "rb") as f:
             svg_content = f.read()
             
             # Count the total number of legend items (rect elements)
-            legend_item_count = svg_content.count('<rect x="')
+            legend_item_count, unique_y_coords = scan_legend_rects(svg_content)
             
             # We should have at least 15 legend items (one for each VLAN)
             self.assertGreaterEqual(legend_item_count, 15, 
                                    f"Expected at least 15 legend items, got {legend_item_count}")
             
             # Check that we have multiple rows of legend items by looking for different y-coordinates
-            # Get all the y-coordinates used for legend items
-            import re
-            y_coords = re.findall(r'<rect x="\d+" y="(\d+)"', svg_content)
-            unique_y_coords = set(y_coords)
+            # (the y-coordinates used for legend items were collected in the same scan)
             
             # We should have at least 2 different y-coordinates (2 rows)
             self.assertGreaterEqual(len(unique_y_coords), 2, 
@@ -77,6 +100,8 @@ class TestMultiRowLegend(unittest.TestCase):
 
     def test_long_vlan_names(self):
         """Test that legend items wrap to multiple rows when VLAN names are long."""
+        output_file = os.path.join(self.output_dir, "long_vlan_names_switch.svg")
+        
         # Create a switch with a few VLANs but with long names
         port_vlan_map = {
             1: 10,  # Administration
@@ -103,7 +128,7 @@ class TestMultiRowLegend(unittest.TestCase):
             switch_name="Long VLAN Names Test",
             switch_width=400,  # Small width to force wrapping
             port_vlan_map=port_vlan_map,
-            output_file="output/long_vlan_names_switch.svg"
+            output_file=output_file
         )
         
         # Inject the custom VLAN names
@@ -114,24 +139,26 @@ class TestMultiRowLegend(unittest.TestCase):
         generator.save_svg()
         
         # Verify the file was created
-        self.assertTrue(os.path.exists("output/long_vlan_names_switch.svg"))
+        self.assertTrue(os.path.exists(output_file))
         
         # Verify the SVG content
-        with open("output/long_vlan_names_switch.svg", "r") as f:
+        with open(output_file, "rb") as f:
             svg_content = f.read()
             
             # Check that we have multiple rows of legend items
             # The first row should start at y=170
-            first_row = svg_content.find('<rect x="30" y="170"')
+            first_row = svg_content.find(b'<rect x="30" y="170"')
             self.assertNotEqual(first_row, -1, "First row of legend items not found")
             
             # There should be at least one more row of legend items
-            # The second row should start at y=195 (170 + 25)
-            second_row = svg_content.find('<rect x="30" y="195"')
+            # The second row should start at y=195 (170 + 25), after the first row
+            second_row = svg_content.find(b'<rect x="30" y="195"', first_row)
             self.assertNotEqual(second_row, -1, "Second row of legend items not found")
 
     def test_narrow_switch(self):
         """Test that legend items wrap to multiple rows when the switch is narrow."""
+        output_file = os.path.join(self.output_dir, "narrow_switch.svg")
+        
         # Create a switch with a narrow width and multiple VLANs to force wrapping
         port_vlan_map = {
             1: 10,  # VLAN 10
@@ -150,24 +177,22 @@ class TestMultiRowLegend(unittest.TestCase):
             switch_name="Narrow Switch Test",
             switch_width=200,  # Extremely narrow width to force wrapping
             port_vlan_map=port_vlan_map,
-            output_file="output/narrow_switch.svg"
+            output_file=output_file
         )
         
         # Generate the SVG
         generator.save_svg()
         
         # Verify the file was created
-        self.assertTrue(os.path.exists("output/narrow_switch.svg"))
+        self.assertTrue(os.path.exists(output_file))
         
         # Verify the SVG content
-        with open("output/narrow_switch.svg", "r") as f:
+        with open(output_file, "rb") as f:
             svg_content = f.read()
             
             # Check that we have multiple rows of legend items by looking for different y-coordinates
             # Get all the y-coordinates used for legend items
-            import re
-            y_coords = re.findall(r'<rect x="\d+" y="(\d+)"', svg_content)
-            unique_y_coords = set(y_coords)
+            _, unique_y_coords = scan_legend_rects(svg_content)
             
             # We should have at least 2 different y-coordinates (2 rows)
             self.assertGreaterEqual(len(unique_y_coords), 2, 
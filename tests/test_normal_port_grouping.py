@@ -26,14 +26,10 @@ def main():
     }
     
     # Define port to VLAN mapping for better visualization of port groups
-    port_vlan_map = {}
-    
     # Alternate VLANs for each port group to make grouping more visible
     # For groups of 4: VLAN 10, 20, 30, 40, 10, 20, ...
-    for i in range(1, 25):
-        group_num = (i - 1) // 4
-        vlan_id = [10, 20, 30, 40][group_num % 4]
-        port_vlan_map[i] = vlan_id
+    vlan_cycle = [10, 20, 30, 40]
+    port_vlan_map = {i: vlan_cycle[(i - 1) // 4 % 4] for i in range(1, 25)}
     
     # Create a switch with port grouping (4 ports per group)
     switch_with_grouping = SwitchSVGGenerator(
@@ -61,11 +57,7 @@ def main():
     
     # Create a switch with port grouping (6 ports per group)
     # Update port to VLAN mapping for groups of 6
-    port_vlan_map = {}
-    for i in range(1, 25):
-        group_num = (i - 1) // 6
-        vlan_id = [10, 20, 30, 40][group_num % 4]
-        port_vlan_map[i] = vlan_id
+    port_vlan_map = {i: vlan_cycle[(i - 1) // 6 % 4] for i in range(1, 25)}
     
     switch_with_grouping_6 = SwitchSVGGenerator(
         num_ports=24,
@@ -92,10 +84,7 @@ def main():
     
     # For comparison, create a switch without port grouping
     # Use alternating VLANs for each port to make it clear there's no grouping
-    port_vlan_map = {}
-    for i in range(1, 25):
-        vlan_id = [10, 20][i % 2]  # Alternate between VLAN 10 and 20
-        port_vlan_map[i] = vlan_id
+    port_vlan_map = {i: [10, 20][i % 2] for i in range(1, 25)}  # Alternate between VLAN 10 and 20
     
     switch_without_grouping = SwitchSVGGenerator(
         num_ports=24,
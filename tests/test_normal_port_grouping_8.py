@@ -26,14 +26,10 @@ def main():
     }
     
     # Define port to VLAN mapping for better visualization of port groups
-    port_vlan_map = {}
-    
     # Alternate VLANs for each port group to make grouping more visible
     # For groups of 8: VLAN 10, 20, 30, 10, 20, ...
-    for i in range(1, 25):
-        group_num = (i - 1) // 8
-        vlan_id = [10, 20, 30][group_num % 3]
-        port_vlan_map[i] = vlan_id
+    vlan_cycle = [10, 20, 30]
+    port_vlan_map = {i: vlan_cycle[(i - 1) // 8 % 3] for i in range(1, 25)}
     
     # Create a switch with port grouping (4 ports per group)
     switch_with_grouping = SwitchSVGGenerator(
@@ -17,11 +17,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme, LayoutMode
 
+# Port rectangles, capturing their x and y coordinates
+_PORT_RECT_RE = re.compile(r'<rect x="(\d+)" y="(\d+)" width="\d+" height="\d+" fill="[^"]+" stroke="#000000" stroke-width="1" rx="\d+" ry="\d+" />')
+
+# Namespace of the elements in the generated SVG
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
 class TestSingleRowSwitch(unittest.TestCase):
     """Test cases for the SwitchSVGGenerator with single row layout."""
 
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
         # Create output directory if it doesn't exist
         os.makedirs("tests/output", exist_ok=True)
 
@@ -53,8 +60,7 @@ class TestSingleRowSwitch(unittest.TestCase):
         port_y_positions = []
         
         # Use regex to find all port rectangles and extract their y-coordinates
-        port_rect_pattern = r'<rect x="(\d+)" y="(\d+)" width="\d+" height="\d+" fill="[^"]+" stroke="#000000" stroke-width="1" rx="\d+" ry="\d+" />'
-        port_matches = re.finditer(port_rect_pattern, svg_content)
+        port_matches = _PORT_RECT_RE.finditer(svg_content)
         
         for match in port_matches:
             y_pos = int(match.group(2))
@@ -98,7 +104,7 @@ class TestSingleRowSwitch(unittest.TestCase):
         zigzag_port_y_positions = []
         
         # Use regex to find all port rectangles and extract their y-coordinates
-        zigzag_port_matches = re.finditer(port_rect_pattern, zigzag_svg_content)
+        zigzag_port_matches = _PORT_RECT_RE.finditer(zigzag_svg_content)
         
         for match in zigzag_port_matches:
             y_pos = int(match.group(2))
@@ -134,44 +140,28 @@ class TestSingleRowSwitch(unittest.TestCase):
         # Verify the file was created
         self.assertTrue(os.path.exists("tests/output/single_row_switch_sfp_test.svg"))
         
-        # Read the SVG content
-        with open("tests/output/single_row_switch_sfp_test.svg", "r") as f:
-            svg_content = f.read()
-        
         # Parse the SVG using ElementTree for more precise element selection
         try:
-            # Replace angle brackets in CDATA sections to avoid XML parsing errors
-            svg_content = re.sub(r'<!\[CDATA\[(.*?)\]\]>', lambda m: '<![CDATA[' + m.group(1).replace('<', '&lt;').replace('>', '&gt;') + ']]>', svg_content)
-            root = ET.fromstring(svg_content)
+            root = ET.parse("tests/output/single_row_switch_sfp_test.svg").getroot()
         except ET.ParseError:
-            # If parsing fails, use a simpler regex approach
             self.skipTest("XML parsing failed, skipping detailed SFP alignment test")
         
-        # Find all port rectangles (both regular and SFP)
+        # Find all port rectangles (both regular and SFP) in a single walk of the tree;
+        # the id prefix of each port group says which list its rectangle belongs to
         port_rects = []
         sfp_rects = []
         
-        # Use regex as a fallback since ElementTree might be complex for SVG
-        regular_port_pattern = r'<g id="port-\d+">[^<]*<title>[^<]*</title>\s*<rect x="(\d+)" y="(\d+)" width="(\d+)" height="(\d+)"'
-        sfp_port_pattern = r'<g id="sfp-\d+">[^<]*<title>[^<]*</title>\s*<rect x="(\d+)" y="(\d+)" width="(\d+)" height="(\d+)"'
-        
-        regular_matches = re.finditer(regular_port_pattern, svg_content)
-        sfp_matches = re.finditer(sfp_port_pattern, svg_content)
-        
-        for match in regular_matches:
-            port_rects.append({
-                'x': int(match.group(1)),
-                'y': int(match.group(2)),
-                'width': int(match.group(3)),
-                'height': int(match.group(4))
-            })
-        
-        for match in sfp_matches:
-            sfp_rects.append({
-                'x': int(match.group(1)),
-                'y': int(match.group(2)),
-                'width': int(match.group(3)),
-                'height': int(match.group(4))
+        for group in root.iter(SVG_NS + "g"):
+            kind = group.get("id", "").split("-", 1)[0]
+            if kind not in ("port", "sfp"):
+                continue
+            rect = group.find(SVG_NS + "rect")
+            rects = port_rects if kind == "port" else sfp_rects
+            rects.append({
+                'x': int(rect.get("x")),
+                'y': int(rect.get("y")),
+                'width': int(rect.get("width")),
+                'height': int(rect.get("height"))
             })
         
         # Verify we found both regular ports and SFP ports
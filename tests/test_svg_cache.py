@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test SVG Cache
+--------------
+This script tests the rendered-SVG cache in SwitchSVGGenerator.
+It verifies that identical configurations are served from the cache and that
+any change to the generator state produces a freshly rendered SVG.
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.switch_svg_generator import SwitchSVGGenerator, PortStatus, PortShape
+
+
+class TestSVGCache(unittest.TestCase):
+    """Test case for the rendered SVG cache in SwitchSVGGenerator."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        SwitchSVGGenerator.clear_svg_cache()
+
+    def test_identical_configuration_hits_cache(self):
+        """Test that two generators with the same inputs share one cache entry."""
+        first = SwitchSVGGenerator(num_ports=24, sfp_ports=2, output_file="first.svg")
+        second = SwitchSVGGenerator(num_ports=24, sfp_ports=2, output_file="second.svg")
+
+        svg = first.generate_svg()
+        self.assertEqual(len(SwitchSVGGenerator._SVG_CACHE), 1)
+        self.assertIs(second.generate_svg(), svg)
+        self.assertEqual(svg, first.render_svg())
+
+    def test_state_change_misses_cache(self):
+        """Test that changing a port mapping renders a new SVG."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        before = generator.generate_svg()
+
+        generator.port_status_map[3] = PortStatus.DOWN
+        after = generator.generate_svg()
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, generator.render_svg())
+        self.assertEqual(len(SwitchSVGGenerator._SVG_CACHE), 2)
+
+    def test_status_change_reuses_port_bodies(self):
+        """Test that a status-only change re-renders without rebuilding port bodies."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        generator.generate_svg()
+        self.assertEqual(len(SwitchSVGGenerator._PORT_BODY_CACHE), 1)
+
+        generator.port_status_map[3] = PortStatus.DISABLED
+        svg = generator.generate_svg()
+
+        self.assertEqual(len(SwitchSVGGenerator._PORT_BODY_CACHE), 1)
+        self.assertIn("Port: 3, Label: 3, Status: disabled", svg)
+
+        generator.port_vlan_map[3] = 20
+        generator.generate_svg()
+        self.assertEqual(len(SwitchSVGGenerator._PORT_BODY_CACHE), 2)
+
+    def test_port_shape_change_after_construction(self):
+        """Test that changing the port shape on an existing generator changes the port corners."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        self.assertIn('rx="0" ry="0"', generator.generate_svg())
+
+        generator.port_shape = PortShape.CIRCULAR
+        radius = min(generator.port_width, generator.port_height) // 2
+        svg = generator.generate_svg()
+
+        self.assertIn(f'rx="{radius}" ry="{radius}"', svg)
+        self.assertEqual(svg, generator.render_svg())
+
+    def test_save_skips_unchanged_output(self):
+        """Test that saving the same state twice leaves the file untouched."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "switch.svg")
+            generator = SwitchSVGGenerator(num_ports=8, output_file=output_file)
+
+            generator.save_svg()
+            mtime = os.stat(output_file).st_mtime_ns
+            generator.save_svg()
+            self.assertEqual(os.stat(output_file).st_mtime_ns, mtime)
+
+            generator.port_status_map[2] = PortStatus.DOWN
+            generator.save_svg()
+            with open(output_file, "r") as f:
+                self.assertEqual(f.read(), generator.render_svg())
+
+    def test_save_rewrites_file_changed_by_another_writer(self):
+        """Test that a save is not skipped when the file was overwritten with the same mtime."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "switch.svg")
+            first = SwitchSVGGenerator(num_ports=8, output_file=output_file)
+            second = SwitchSVGGenerator(num_ports=8, output_file=output_file)
+            second.port_status_map[2] = PortStatus.DOWN
+
+            first.save_svg()
+            stat = os.stat(output_file)
+            second.save_svg()
+            os.utime(output_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            first.save_svg()
+            with open(output_file, "r") as f:
+                self.assertEqual(f.read(), first.render_svg())
+
+    def test_failed_render_keeps_existing_file(self):
+        """Test that a rendering error leaves a previously saved file untouched."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "switch.svg")
+            generator = SwitchSVGGenerator(num_ports=8, output_file=output_file)
+            generator.save_svg()
+            with open(output_file, "rb") as f:
+                saved = f.read()
+
+            # A plain string is not a PortStatus, so rendering fails; the
+            # exact error depends on where rendering first uses the status
+            generator.port_status_map[3] = "up"
+            with self.assertRaises(Exception):
+                generator.save_svg()
+
+            with open(output_file, "rb") as f:
+                self.assertEqual(f.read(), saved)
+
+    def test_mixed_key_types(self):
+        """Test that mappings with keys of different types can be cached."""
+        generator = SwitchSVGGenerator(num_ports=8, port_labels={1: "WAN", "2": "LAN"})
+        svg = generator.generate_svg()
+
+        self.assertIs(generator.generate_svg(), svg)
+        self.assertIn("Label: WAN", svg)
+
+    def test_ad_hoc_attribute(self):
+        """Test that callers can still attach their own attributes to a generator."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        svg = generator.generate_svg()
+
+        generator.note = "rack 4"
+        self.assertEqual(generator.note, "rack 4")
+        self.assertEqual(generator.generate_svg(), svg)
+
+    def test_clear_svg_cache(self):
+        """Test that clearing the cache forces a fresh render."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        svg = generator.generate_svg()
+
+        SwitchSVGGenerator.clear_svg_cache()
+        self.assertEqual(len(SwitchSVGGenerator._SVG_CACHE), 0)
+        self.assertEqual(len(SwitchSVGGenerator._PORT_BODY_CACHE), 0)
+
+        fresh = generator.generate_svg()
+        self.assertIsNot(fresh, svg)
+        self.assertEqual(fresh, svg)
+
+    def test_cache_is_bounded(self):
+        """Test that the oldest entries are evicted once the cache is full."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        for i in range(SwitchSVGGenerator._SVG_CACHE_MAXSIZE + 5):
+            generator.switch_name = f"Switch {i}"
+            generator.generate_svg()
+
+        self.assertEqual(len(SwitchSVGGenerator._SVG_CACHE), SwitchSVGGenerator._SVG_CACHE_MAXSIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test SVG Header
+---------------
+This script tests the header that SwitchSVGGenerator writes at the top of
+every SVG. It verifies that the document opens with the XML declaration and
+exactly one <svg> root tag carrying the calculated size.
+"""
+
+import sys
+import os
+import unittest
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.switch_svg_generator import SwitchSVGGenerator, Theme
+
+
+class TestSVGHeader(unittest.TestCase):
+    """Test case for the SVG header generated by SwitchSVGGenerator."""
+
+    def test_header_opens_document(self):
+        """Test that the header starts with the XML declaration and a single <svg> tag."""
+        for theme in Theme:
+            generator = SwitchSVGGenerator(num_ports=24, sfp_ports=2, theme=theme)
+            header = "\n".join(generator.generate_svg_header(640, 220))
+
+            self.assertTrue(header.startswith('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n<svg '))
+            self.assertEqual(header.count("<svg"), 1)
+            self.assertIn('<svg width="640" height="220"', header)
+
+    def test_rendered_svg_starts_with_header(self):
+        """Test that a full render begins with the generated header."""
+        generator = SwitchSVGGenerator(num_ports=8)
+        width, height, _, _ = generator.calculate_dimensions()
+        header = "\n".join(generator.generate_svg_header(width, height))
+
+        svg = generator.render_svg()
+        self.assertTrue(svg.startswith(header + "\n"))
+        self.assertEqual(svg.count("<svg"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
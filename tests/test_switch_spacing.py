@@ -25,12 +25,14 @@ original_generator = SwitchSVGGenerator(
 original_generator.save_svg()
 print("Generated original switch SVG at: output/switch_original.svg")
 
+# Switch body markup: the comment line and the body rectangle in one template
+_BODY_TMPL = ('  <!-- Switch body -->\n'
+              '  <rect x="10" y="10" width="%s" height="%s" rx="10" ry="10" fill="%s" '
+              'stroke="%s" stroke-width="%s" />')
+
 # Create a custom subclass that overrides the generate_switch_body method
 class FixedSpacingSwitchGenerator(SwitchSVGGenerator):
     def generate_switch_body(self, adjusted_width, adjusted_height):
-        svg = []
-        svg.append(f'  <!-- Switch body -->')
-        
         # Use the switch_height for the body height
         body_height = self.switch_height - 20  # -20 for the margins (10px top and bottom)
         
@@ -39,11 +41,9 @@ class FixedSpacingSwitchGenerator(SwitchSVGGenerator):
         # Left spacing = 30 - 10 = 20px
         # For right spacing to be 20px, body width should be (382 + 28 + 20) - 10 = 420px
         body_width = 420
-            
-        svg.append(f'  <rect x="10" y="10" width="{body_width}" height="{body_height}" '
-                  f'rx="10" ry="10" fill="{self.switch_body_color}" '
-                  f'stroke="{self.switch_body_border_color}" stroke-width="{self.switch_body_border_width}" />')
-        return svg
+        
+        return [_BODY_TMPL % (body_width, body_height, self.switch_body_color,
+                              self.switch_body_border_color, self.switch_body_border_width)]
 
 # Generate fixed switch
 fixed_generator = FixedSpacingSwitchGenerator(
@@ -131,7 +131,7 @@ html_content = """<!DOCTYPE html>
 </html>
 """
 
-with open("output/switch_spacing_comparison.html", "w") as f:
+with open("output/switch_spacing_comparison.html", "w", encoding="utf-8", newline="") as f:
     f.write(html_content)
 print("Created comparison HTML at: output/switch_spacing_comparison.html")
 
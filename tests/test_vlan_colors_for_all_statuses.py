@@ -74,5 +74,7 @@ generator = SwitchSVGGenerator(
 generator.save_svg()
 print(f"SVG saved to tests/output/vlan_colors_test.svg")
 
-# Preview the SVG in the default web browser
-generator.preview_svg()
+# Preview the SVG in the default web browser, but only when run as a script
+# so that automated test runs never launch a browser
+if __name__ == "__main__":
+    generator.preview_svg()
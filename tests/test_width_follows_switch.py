@@ -36,10 +36,8 @@ def main():
     
     # Test 3: Large switch (48 ports with SFP)
     # Define VLAN assignments for each port to create more legend items
-    port_vlan_map = {}
-    for i in range(1, 49):
-        # Assign different VLANs to create more legend items
-        port_vlan_map[i] = (i % 8) * 10  # VLANs 0, 10, 20, 30, 40, 50, 60, 70
+    # VLANs 0, 10, 20, 30, 40, 50, 60, 70
+    port_vlan_map = {i: (i % 8) * 10 for i in range(1, 49)}
     
     large_switch = SwitchSVGGenerator(
         num_ports=48,
@@ -5,13 +5,27 @@ This script generates switches with both the original and fixed spacing and crea
 """
 
 import os
+import re
 import webbrowser
 from src.switch_svg_generator import SwitchSVGGenerator, SwitchModel, Theme, PortStatus
 
+class _OriginalSpacingGenerator(SwitchSVGGenerator):
+    """Generator that reproduces the original, uneven spacing."""
+    
+    def calculate_dimensions(self):
+        dimensions = super().calculate_dimensions()
+        
+        # Simulate the original spacing issue by narrowing the body to the
+        # actual body width minus the margins. This runs on every render, so
+        # the change is not undone when save_svg() recalculates dimensions
+        self.body_width = self.actual_body_width - 20
+        
+        return dimensions
+
 def generate_original_spacing_switch(num_ports, output_file):
     """Generate a switch with the original spacing."""
     # Create a switch with the specified number of ports
-    generator = SwitchSVGGenerator(
+    generator = _OriginalSpacingGenerator(
         num_ports=num_ports,
         switch_model=SwitchModel.ENTERPRISE,
         switch_name=f"{num_ports}-Port Switch (Original Spacing)",
@@ -19,13 +33,6 @@ def generate_original_spacing_switch(num_ports, output_file):
         output_file=output_file
     )
     
-    # Calculate dimensions to initialize body_width and actual_body_width
-    generator.calculate_dimensions()
-    
-    # Modify the body_width calculation to simulate the original spacing issue
-    # This is done by using the actual_body_width instead of body_width
-    generator.body_width = generator.actual_body_width - 20
-    
     # Save the SVG
     generator.save_svg()
     
@@ -47,11 +54,20 @@ def generate_fixed_spacing_switch(num_ports, output_file):
     
     return output_file
 
-def create_html_comparison(original_files, fixed_files):
-    """Create an HTML file to compare the original and fixed spacing."""
-    html_file = "output/spacing_comparison.html"
-    
-    html_content = """
+# Port count in a file name, e.g. "24-port" or "original_spacing_24_ports.svg"
+_PORT_COUNT_RE = re.compile(r'(?<!\d)(\d+)[-_]ports?', re.IGNORECASE)
+
+def index_by_port_count(files):
+    """Map each port count to the first file whose name mentions it."""
+    files_by_count = {}
+    for file in files:
+        match = _PORT_COUNT_RE.search(file)
+        if match:
+            files_by_count.setdefault(int(match.group(1)), file)
+    return files_by_count
+
+# Static parts of the comparison page
+_HTML_HEADER = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -81,16 +97,30 @@ def create_html_comparison(original_files, fixed_files):
         <p>This page compares switches with the original spacing issue (uneven spacing) and the fixed spacing (equal spacing on both sides).</p>
         <p>The yellow highlight shows the spacing between the switch edge and the ports.</p>
     """
+
+_HTML_FOOTER = """
+    </body>
+    </html>
+    """
+
+def create_html_comparison(original_files, fixed_files):
+    """Create an HTML file to compare the original and fixed spacing."""
+    html_file = "output/spacing_comparison.html"
     
     # Sort files by port count
     port_counts = [8, 16, 24, 48]
+    original_by_count = index_by_port_count(original_files)
+    fixed_by_count = index_by_port_count(fixed_files)
     
-    for port_count in port_counts:
-        original_file = next((f for f in original_files if f"{port_count}-port" in f.lower()), None)
-        fixed_file = next((f for f in fixed_files if f"{port_count}-port" in f.lower()), None)
+    with open(html_file, "w") as out:
+        out.write(_HTML_HEADER)
         
-        if original_file and fixed_file:
-            html_content += f"""
+        for port_count in port_counts:
+            original_file = original_by_count.get(port_count)
+            fixed_file = fixed_by_count.get(port_count)
+        
+            if original_file and fixed_file:
+                out.write(f"""
             <div class="port-count">{port_count}-Port Switch</div>
             <div class="comparison-container">
                 <div class="switch-container">
@@ -110,15 +140,9 @@ def create_html_comparison(original_files, fixed_files):
                     </div>
                 </div>
             </div>
-            """
-    
-    html_content += """
-    </body>
-    </html>
-    """
-    
-    with open(html_file, "w") as f:
-        f.write(html_content)
+            """)
+        
+        out.write(_HTML_FOOTER)
     
     return html_file
 
@@ -7,6 +7,21 @@ This script modifies existing SVG files to make the legend more prominent.
 import re
 import sys
 
+# Patterns compiled once and reused for every file processed
+_SVG_SIZE_RE = re.compile(r'<svg width="(\d+)" height="(\d+)"')
+_TEXT_COLOR_RE = re.compile(r'font-family="Arial" font-size="16" fill="(#[0-9a-fA-F]+)"')
+_BG_COLOR_RE = re.compile(r'<rect x="0" y="0" width="\d+" height="\d+" fill="(#[0-9a-fA-F]+)" />')
+_LEGEND_ITEM_RE = re.compile(r'<rect x="(\d+)" y="(\d+)" width="10" height="10" fill="([^"]+)" />\s*<text x="[^"]+" y="[^"]+" font-family="Arial" font-size="10" fill="[^"]+">([^<]+)</text>')
+_SVG_ATTRS_RE = re.compile(r'<svg\s+([^>]+)>')
+
+# The legend section runs from this comment up to the first port group,
+# or to the end of the file when the ports come first
+_LEGEND_MARKER = '<!-- Legend -->'
+_FIRST_PORT_TAG = '<g id="port-1">'
+
+# Background colors of the light themes
+_LIGHT_BGS = frozenset({"#ffffff", "#d3d3d3", "#f0f0f0", "#e0e0e0"})
+
 def enhance_legend(svg_file):
     """
     Enhance the visibility of the legend in an SVG file.
@@ -14,22 +29,30 @@ def enhance_legend(svg_file):
     Args:
         svg_file: Path to the SVG file to modify
     """
-    # Read the SVG file
-    with open(svg_file, 'r') as f:
-        svg_content = f.read()
-    
     # Check if the file starts with XML declaration and SVG tag
     xml_decl = '<?xml version="1.0" encoding="UTF-8" standalone="no"?>'
     svg_start = '<svg'
     
-    if not svg_content.startswith(xml_decl):
-        print(f"Warning: SVG file {svg_file} does not start with XML declaration")
-        if not svg_content.startswith(svg_start):
-            print(f"Error: SVG file {svg_file} does not start with SVG tag")
-            return
+    with open(svg_file, 'r') as f:
+        # Only the start of the file is needed to reject non-SVG input, so
+        # the rest is read once the prefix checks have passed
+        head = f.read(512)
+        
+        if not head.startswith(xml_decl):
+            print(f"Warning: SVG file {svg_file} does not start with XML declaration")
+            if not head.startswith(svg_start):
+                print(f"Error: SVG file {svg_file} does not start with SVG tag")
+                return
+        
+        # Read the rest of the SVG file
+        svg_content = head + f.read()
+    
+    # Capture the root element attributes from the unmodified file, so it
+    # does not need to be read again before writing the enhanced copy
+    svg_attrs_match = _SVG_ATTRS_RE.search(svg_content)
     
     # Find the SVG dimensions
-    width_match = re.search(r'<svg width="(\d+)" height="(\d+)"', svg_content)
+    width_match = _SVG_SIZE_RE.search(svg_content)
     if not width_match:
         print(f"Error: Could not find SVG dimensions in {svg_file}")
         return
@@ -38,16 +61,17 @@ def enhance_legend(svg_file):
     height = int(width_match.group(2))
     
     # Find the legend section
-    legend_match = re.search(r'(<!-- Legend -->.*?)<g id="port-1">', svg_content, re.DOTALL)
-    if not legend_match:
-        # Try another pattern if the first one doesn't match
-        legend_match = re.search(r'(<!-- Legend -->.*?)$', svg_content, re.DOTALL)
-        if not legend_match:
-            print(f"Error: Could not find legend section in {svg_file}")
-            return
+    legend_start = svg_content.find(_LEGEND_MARKER)
+    if legend_start == -1:
+        print(f"Error: Could not find legend section in {svg_file}")
+        return
+    legend_end = svg_content.find(_FIRST_PORT_TAG, legend_start)
+    if legend_end == -1:
+        # Otherwise the legend runs to the end, keeping any final newline
+        legend_end = len(svg_content) - svg_content.endswith('\n')
     
     # Extract the theme color (text color)
-    text_color_match = re.search(r'font-family="Arial" font-size="16" fill="(#[0-9a-fA-F]+)"', svg_content)
+    text_color_match = _TEXT_COLOR_RE.search(svg_content)
     if not text_color_match:
         print(f"Warning: Could not determine text color in {svg_file}, using default")
         text_color = "#000000"
@@ -55,7 +79,7 @@ def enhance_legend(svg_file):
         text_color = text_color_match.group(1)
     
     # Extract the background color
-    bg_color_match = re.search(r'<rect x="0" y="0" width="\d+" height="\d+" fill="(#[0-9a-fA-F]+)" />', svg_content)
+    bg_color_match = _BG_COLOR_RE.search(svg_content)
     if not bg_color_match:
         print(f"Warning: Could not determine background color in {svg_file}, using default")
         bg_color = "#ffffff"
@@ -64,7 +88,7 @@ def enhance_legend(svg_file):
     
     # Determine contrasting color for legend background
     # If background is light, use a slightly darker shade; if dark, use a slightly lighter shade
-    if bg_color.lower() in ["#ffffff", "#d3d3d3", "#f0f0f0", "#e0e0e0"]:
+    if bg_color.lower() in _LIGHT_BGS:
         # Light background - use a slightly darker shade
         legend_bg_color = "#c0c0c0"
     else:
@@ -77,7 +101,7 @@ def enhance_legend(svg_file):
     # 3. Add a border around the legend
     
     # Find all legend items
-    legend_items = re.findall(r'<rect x="(\d+)" y="(\d+)" width="10" height="10" fill="([^"]+)" />\s*<text x="[^"]+" y="[^"]+" font-family="Arial" font-size="10" fill="[^"]+">([^<]+)</text>', svg_content)
+    legend_items = _LEGEND_ITEM_RE.findall(svg_content)
     
     if not legend_items:
         print(f"Error: Could not find legend items in {svg_file}")
@@ -90,10 +114,10 @@ def enhance_legend(svg_file):
     legend_y = 160  # Fixed position below the switch
     
     # Create new legend section
-    new_legend = f"""  <!-- Enhanced Legend -->
+    new_legend_parts = [f"""  <!-- Enhanced Legend -->
   <rect x="{legend_x}" y="{legend_y}" width="{legend_width}" height="{legend_height}" fill="{legend_bg_color}" rx="5" ry="5" stroke="{text_color}" stroke-width="1" />
   <text x="{legend_x + 10}" y="{legend_y + 20}" font-family="Arial" font-size="14" font-weight="bold" fill="{text_color}">Legend:</text>
-"""
+"""]
     
     # Add legend items in a horizontal layout
     item_spacing = legend_width // (len(legend_items) + 1)
@@ -101,38 +125,33 @@ def enhance_legend(svg_file):
         item_x = legend_x + (i + 1) * item_spacing - 50  # Distribute evenly
         item_y = legend_y + 40  # Fixed vertical position
         
-        new_legend += f"""  <rect x="{item_x}" y="{item_y - 10}" width="15" height="15" fill="{color}" stroke="{text_color}" stroke-width="0.5" />
+        new_legend_parts.append(f"""  <rect x="{item_x}" y="{item_y - 10}" width="15" height="15" fill="{color}" stroke="{text_color}" stroke-width="0.5" />
   <text x="{item_x + 20}" y="{item_y}" font-family="Arial" font-size="12" fill="{text_color}">{label}</text>
-"""
-    
-    # Replace the old legend section with the new one
-    if legend_match:
-        old_legend = legend_match.group(1)
-        svg_content = svg_content.replace(old_legend, new_legend)
-        
-    # Ensure the SVG has a closing tag
-    if not svg_content.strip().endswith('</svg>'):
-        svg_content = svg_content.rstrip() + '\n</svg>'
+""")
+    new_legend = "".join(new_legend_parts)
     
     # Write the modified SVG file
     output_file = svg_file.replace('.svg', '_enhanced.svg')
     
-    # Create a completely new SVG file with the correct XML declaration and SVG tag
-    with open(svg_file, 'r') as f:
-        original_content = f.read()
-    
-    # Extract the SVG attributes
-    svg_attrs_match = re.search(r'<svg\s+([^>]+)>', original_content)
+    # Create a completely new SVG file with the correct XML declaration and SVG tag,
+    # using the SVG attributes extracted from the original file
     if not svg_attrs_match:
         print(f"Error: Could not extract SVG attributes from {svg_file}")
         return
     
     svg_attrs = svg_attrs_match.group(1)
     
+    # Splice the new legend into everything after the opening SVG tag
+    body = svg_content[svg_attrs_match.end():legend_start] + new_legend + svg_content[legend_end:]
+    
+    # Ensure the SVG has a closing tag
+    if not body.strip().endswith('</svg>'):
+        body = body.rstrip() + '\n</svg>'
+    
     # Create the new SVG content with the correct XML declaration and SVG tag
     new_svg_content = f"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
 <svg {svg_attrs}>
-{svg_content.split('<svg ' + svg_attrs + '>', 1)[1] if '<svg ' + svg_attrs + '>' in svg_content else svg_content.split('<svg', 1)[1].split('>', 1)[1]}"""
+""" + body
     
     with open(output_file, 'w') as f:
         f.write(new_svg_content)